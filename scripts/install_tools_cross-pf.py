@@ -4,16 +4,46 @@ import sys
 import subprocess
 import urllib.request
 import zipfile
+import posixpath
 import logging
 from pathlib import Path
 from datetime import datetime
 import ctypes
 import shutil
+import hashlib
+import importlib
+import importlib.metadata
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    from zlib_ng import zlib_ng as _fast_zlib
+except ImportError:
+    try:
+        from isal import isal_zlib as _fast_zlib
+    except ImportError:
+        _fast_zlib = None
+
+if _fast_zlib is not None:
+    zipfile.zlib = _fast_zlib
+    zipfile.crc32 = _fast_zlib.crc32
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_REPO_ROOT / "src"))
 from paths import TOOLS_DIR, LOGS_DIR, DOWNLOADS_DIR
 
+RUN_STARTED = datetime.now()
+RUN_ID = RUN_STARTED.strftime('%Y%m%d_%H%M%S')
+
 TOOLS_CONFIG = {
     "sysinternals": {
         "url": "https://download.sysinternals.com/files/SysinternalsSuite.zip",
@@ -41,9 +71,42 @@ TOOLS_CONFIG = {
     }
 }
 
+DOWNLOAD_PATHS = {
+    "sysinternals": DOWNLOADS_DIR / "SysinternalsSuite.zip",
+    "wireshark": DOWNLOADS_DIR / "Wireshark-installer.exe",
+    "winpmem": TOOLS_CONFIG["winpmem"]["destination"] / "winpmem_mini_x64_rc2.exe",
+    "ghidra": DOWNLOADS_DIR / "ghidra.zip",
+}
+
+VERIFICATION_CHECKS = {
+    "sysinternals": {"paths": [TOOLS_DIR / "sysinternals" / "procmon.exe"]},
+    "wireshark": {
+        "commands": ["tshark"],
+        "paths": [
+            Path("C:/Program Files/Wireshark/tshark.exe"),
+            Path("C:/Program Files (x86)/Wireshark/tshark.exe"),
+        ],
+    },
+    "winpmem": {"paths": [TOOLS_DIR / "winpmem" / "winpmem_mini_x64_rc2.exe"]},
+    "volatility": {"packages": ["volatility3"]},
+    "ghidra": {"paths": [TOOLS_DIR / "ghidra"]},
+}
+
+MAX_PARALLEL_DOWNLOADS = 4
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PROGRESS_REPORT_INTERVAL = 4 * 1024 * 1024
+EXTRACT_WORKERS = min(os.cpu_count() or 1, 8)
+PARALLEL_EXTRACT_THRESHOLD = 256
+
+_download_futures = {}
+_download_digests = {}
+
+_session = None
+_session_lock = threading.Lock()
+
 def setup_logging():
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
-    log_file = LOGS_DIR / f"installation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    log_file = LOGS_DIR / f"installation_{RUN_ID}.log"
 
     logging.basicConfig(
         level=logging.INFO,
@@ -73,120 +136,243 @@ def elevate_privileges():
 
 def create_directories():
     directories = [TOOLS_DIR, LOGS_DIR, DOWNLOADS_DIR]
+
+    listings = {}
+    missing = []
     for directory in directories:
+        parent = directory.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries if entry.is_dir()}
+            except OSError:
+                listings[parent] = set()
+        if directory.name not in listings[parent]:
+            missing.append(directory)
+
+    for directory in missing:
         directory.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created/verified directory: {directory}")
+
+    logger.info("Verified %d directories (%d created)", len(directories), len(missing))
+
+def _get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            adapter = HTTPAdapter(
+                pool_maxsize=MAX_PARALLEL_DOWNLOADS,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+@contextlib.contextmanager
+def open_url(url):
+    if REQUESTS_AVAILABLE:
+        with _get_session().get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield response.raw, response.headers
+    else:
+        with urllib.request.urlopen(url) as response:
+            yield response, response.headers
+
+class _ProgressWriter:
+    def __init__(self, file_obj, label, total_size):
+        self._file = file_obj
+        self._label = label
+        self._total_size = total_size
+        self._downloaded = 0
+        self._last_reported = 0
+
+    def write(self, data):
+        written = self._file.write(data)
+        self._downloaded += len(data)
+        if self._downloaded - self._last_reported >= PROGRESS_REPORT_INTERVAL:
+            self._last_reported = self._downloaded
+            if self._total_size:
+                percent = min(self._downloaded * 100 / self._total_size, 100)
+                sys.stdout.write(f"\r{self._label}: {percent:.1f}%")
+            else:
+                sys.stdout.write(f"\r{self._label}: {self._downloaded / (1024*1024):.0f} MB")
+            sys.stdout.flush()
+        return written
 
 def download_file(url, destination):
     try:
-        logger.info(f"Downloading from: {url}")
+        logger.info("Downloading from: %s", url)
+        Path(destination).parent.mkdir(parents=True, exist_ok=True)
 
-        def progress_hook(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = min(downloaded * 100 / total_size, 100)
-            sys.stdout.write(f"\rProgress: {percent:.1f}%")
-            sys.stdout.flush()
+        with open_url(url) as (response, headers), open(destination, 'wb') as f:
+            total_size = int(headers.get("Content-Length") or 0)
+            writer = _ProgressWriter(f, Path(destination).name, total_size)
+            shutil.copyfileobj(response, writer, length=DOWNLOAD_CHUNK_SIZE)
 
-        urllib.request.urlretrieve(url, destination, progress_hook)
         print()
-        logger.info(f"Downloaded successfully to: {destination}")
+        logger.info("Downloaded successfully to: %s", destination)
         return True
     except Exception as e:
-        logger.error(f"Download failed: {e}")
+        logger.error("Download failed: %s", e)
         return False
 
+def _extract_members(zip_path, members, destination):
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for member in members:
+            zip_ref.extract(member, destination)
+
 def extract_zip(zip_path, destination):
     try:
-        logger.info(f"Extracting {zip_path} to {destination}")
+        logger.info("Extracting %s to %s", zip_path, destination)
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(destination)
-        logger.info("Extraction completed")
+            members = zip_ref.infolist()
+            if len(members) < PARALLEL_EXTRACT_THRESHOLD or EXTRACT_WORKERS < 2:
+                zip_ref.extractall(destination)
+                logger.info("Extraction completed")
+                return True
+
+            directories = {m.filename.rstrip("/") for m in members if m.is_dir()}
+            directories.update(posixpath.dirname(m.filename) for m in members if not m.is_dir())
+            directories.discard("")
+            for directory in sorted(directories):
+                zip_ref.extract(zipfile.ZipInfo(directory + "/"), destination)
+
+        files = [m for m in members if not m.is_dir()]
+        batches = [files[i::EXTRACT_WORKERS] for i in range(EXTRACT_WORKERS)]
+        with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor:
+            futures = [executor.submit(_extract_members, zip_path, batch, destination) for batch in batches]
+            for future in futures:
+                future.result()
+
+        logger.info("Extraction completed (%d files, %d workers)", len(files), EXTRACT_WORKERS)
         return True
     except Exception as e:
-        logger.error(f"Extraction failed: {e}")
+        logger.error("Extraction failed: %s", e)
+        return False
+
+def compute_sha256(file_path):
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def verify_download(tool_name, file_path):
+    digest = compute_sha256(file_path)
+    _download_digests[tool_name] = digest
+    logger.info("SHA-256 for %s: %s", Path(file_path).name, digest)
+
+    expected = TOOLS_CONFIG[tool_name].get("sha256")
+    if expected and expected.lower() != digest:
+        logger.error("SHA-256 mismatch for %s: expected %s, got %s", tool_name, expected, digest)
+        return False
+    return True
+
+def _download_and_unpack(tool_name):
+    config = TOOLS_CONFIG[tool_name]
+    download_path = DOWNLOAD_PATHS[tool_name]
+
+    if not download_file(config["url"], download_path):
         return False
 
+    if config["type"] != "zip":
+        return verify_download(tool_name, download_path)
+
+    if config.get("sha256"):
+        return verify_download(tool_name, download_path) and extract_zip(download_path, config["destination"])
+
+    with ThreadPoolExecutor(max_workers=1) as hasher:
+        hashed = hasher.submit(verify_download, tool_name, download_path)
+        extracted = extract_zip(download_path, config["destination"])
+    return hashed.result() and extracted
+
+def start_downloads(executor, tool_names):
+    for tool_name in tool_names:
+        if tool_name in DOWNLOAD_PATHS:
+            _download_futures[tool_name] = executor.submit(_download_and_unpack, tool_name)
+
+def fetch_tool(tool_name):
+    future = _download_futures.pop(tool_name, None)
+    if future is not None:
+        return future.result()
+    return _download_and_unpack(tool_name)
+
 def run_installer(installer_path, silent_args=None):
     try:
         cmd = [str(installer_path)]
         if silent_args:
             cmd.extend(silent_args)
 
-        logger.info(f"Running installer: {' '.join(cmd)}")
+        logger.info("Running installer: %s", " ".join(cmd))
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
 
         if result.returncode == 0:
             logger.info("Installation completed successfully")
             return True
         else:
-            logger.error(f"Installation failed with return code: {result.returncode}")
-            logger.error(f"Error output: {result.stderr}")
+            logger.error("Installation failed with return code: %d", result.returncode)
+            logger.error("Error output: %s", result.stderr)
             return False
     except subprocess.TimeoutExpired:
         logger.error("Installation timed out")
         return False
     except Exception as e:
-        logger.error(f"Installation error: {e}")
+        logger.error("Installation error: %s", e)
         return False
 
 def install_pip_package(package_name):
     try:
-        logger.info(f"Installing pip package: {package_name}")
+        logger.info("Installing pip package: %s", package_name)
         result = subprocess.run(
             [sys.executable, "-m", "pip", "install", package_name],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
 
         if result.returncode == 0:
-            logger.info(f"Package {package_name} installed successfully")
+            logger.info("Package %s installed successfully", package_name)
             return True
         else:
-            logger.error(f"pip installation failed: {result.stderr}")
+            logger.error("pip installation failed: %s", result.stderr)
             return False
     except Exception as e:
-        logger.error(f"pip installation error: {e}")
+        logger.error("pip installation error: %s", e)
+        return False
+
+def is_pip_package_installed(package_name):
+    importlib.invalidate_caches()
+    try:
+        importlib.metadata.distribution(package_name)
+        return True
+    except importlib.metadata.PackageNotFoundError:
         return False
 
+def _check_passes(check):
+    return (
+        any(shutil.which(command) for command in check.get("commands", ()))
+        or any(path.exists() for path in check.get("paths", ()))
+        or any(is_pip_package_installed(package) for package in check.get("packages", ()))
+    )
+
 def verify_tool_installation(tool_name):
-    def check_wireshark():
-        if shutil.which("tshark"):
-            return True
-        common_tshark_paths = [
-            Path("C:/Program Files/Wireshark/tshark.exe"),
-            Path("C:/Program Files (x86)/Wireshark/tshark.exe"),
-        ]
-        return any(path.exists() for path in common_tshark_paths)
-
-    verification_commands = {
-        "sysinternals": lambda: (TOOLS_DIR / "sysinternals" / "procmon.exe").exists(),
-        "wireshark": check_wireshark,
-        "winpmem": lambda: (TOOLS_DIR / "winpmem" / "winpmem_mini_x64_rc2.exe").exists(),
-        "volatility": lambda: subprocess.run(
-            [sys.executable, "-m", "pip", "show", "volatility3"],
-            capture_output=True
-        ).returncode == 0,
-        "ghidra": lambda: (TOOLS_DIR / "ghidra").exists()
-    }
+    check = VERIFICATION_CHECKS.get(tool_name)
+    if check is None:
+        return False
 
-    if tool_name in verification_commands:
-        result = verification_commands[tool_name]()
-        logger.info(f"Verification for {tool_name}: {'PASSED' if result else 'FAILED'}")
-        return result
-    return False
+    result = _check_passes(check)
+    logger.info("Verification for %s: %s", tool_name, "PASSED" if result else "FAILED")
+    return result
 
 def install_sysinternals():
     logger.info("=" * 50)
     logger.info("Installing Sysinternals Suite")
     logger.info("=" * 50)
 
-    config = TOOLS_CONFIG["sysinternals"]
-    download_path = DOWNLOADS_DIR / "SysinternalsSuite.zip"
-
-    if not download_file(config["url"], download_path):
-        return False
-
-    if not extract_zip(download_path, config["destination"]):
+    if not fetch_tool("sysinternals"):
         return False
 
     return verify_tool_installation("sysinternals")
@@ -197,9 +383,9 @@ def install_wireshark():
     logger.info("=" * 50)
 
     config = TOOLS_CONFIG["wireshark"]
-    download_path = DOWNLOADS_DIR / "Wireshark-installer.exe"
+    download_path = DOWNLOAD_PATHS["wireshark"]
 
-    if not download_file(config["url"], download_path):
+    if not fetch_tool("wireshark"):
         return False
 
     if not run_installer(download_path, config["silent_args"]):
@@ -212,11 +398,7 @@ def install_winpmem():
     logger.info("Installing WinPMEM")
     logger.info("=" * 50)
 
-    config = TOOLS_CONFIG["winpmem"]
-    config["destination"].mkdir(exist_ok=True)
-    download_path = config["destination"] / "winpmem_mini_x64_rc2.exe"
-
-    if not download_file(config["url"], download_path):
+    if not fetch_tool("winpmem"):
         return False
 
     return verify_tool_installation("winpmem")
@@ -238,47 +420,49 @@ def install_ghidra():
     logger.info("Installing Ghidra")
     logger.info("=" * 50)
 
-    config = TOOLS_CONFIG["ghidra"]
-    download_path = DOWNLOADS_DIR / "ghidra.zip"
-
     logger.info("Note: Ghidra requires Java Runtime Environment (JRE) 17+")
 
-    if not download_file(config["url"], download_path):
-        return False
-
-    if not extract_zip(download_path, config["destination"]):
+    if not fetch_tool("ghidra"):
         return False
 
     return verify_tool_installation("ghidra")
 
 def generate_installation_report(results):
-    report_path = LOGS_DIR / f"installation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    report_path = LOGS_DIR / f"installation_report_{RUN_ID}.txt"
+
+    lines = [
+        "=" * 60 + "\n",
+        "FORENSIC TOOLS INSTALLATION REPORT\n",
+        "=" * 60 + "\n\n",
+        f"Installation Date: {RUN_STARTED.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        "Installation Results:\n",
+        "-" * 60 + "\n",
+    ]
 
-    with open(report_path, 'w') as f:
-        f.write("=" * 60 + "\n")
-        f.write("FORENSIC TOOLS INSTALLATION REPORT\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(f"Installation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    for tool, status in results.items():
+        status_str = "✓ SUCCESS" if status else "✗ FAILED"
+        lines.append(f"{tool.ljust(20)}: {status_str}\n")
 
-        f.write("Installation Results:\n")
-        f.write("-" * 60 + "\n")
+    if _download_digests:
+        lines.append("\nDownload SHA-256 Digests:\n")
+        lines.append("-" * 60 + "\n")
+        for tool, digest in _download_digests.items():
+            lines.append(f"{tool.ljust(20)}: {digest}\n")
 
-        for tool, status in results.items():
-            status_str = "✓ SUCCESS" if status else "✗ FAILED"
-            f.write(f"{tool.ljust(20)}: {status_str}\n")
+    lines.append("\n" + "=" * 60 + "\n")
 
-        f.write("\n" + "=" * 60 + "\n")
+    success_count = sum(results.values())
+    total_count = len(results)
+    lines.append(f"Summary: {success_count}/{total_count} tools installed successfully\n")
 
-        success_count = sum(results.values())
-        total_count = len(results)
-        f.write(f"Summary: {success_count}/{total_count} tools installed successfully\n")
+    if success_count == total_count:
+        lines.append("\nStatus: ALL TOOLS INSTALLED SUCCESSFULLY ✓\n")
+    else:
+        lines.append("\nStatus: SOME INSTALLATIONS FAILED - Review logs for details\n")
 
-        if success_count == total_count:
-            f.write("\nStatus: ALL TOOLS INSTALLED SUCCESSFULLY ✓\n")
-        else:
-            f.write("\nStatus: SOME INSTALLATIONS FAILED - Review logs for details\n")
+    report_path.write_text("".join(lines), encoding="utf-8")
 
-    logger.info(f"Installation report saved to: {report_path}")
+    logger.info("Installation report saved to: %s", report_path)
     return report_path
 
 def main():
@@ -303,13 +487,16 @@ def main():
         ("ghidra", install_ghidra)
     ]
 
-    for tool_name, install_func in tools_to_install:
-        try:
-            results[tool_name] = install_func()
-        except Exception as e:
-            logger.error(f"Unexpected error installing {tool_name}: {e}")
-            results[tool_name] = False
-        print()
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as executor:
+        start_downloads(executor, [tool_name for tool_name, _ in tools_to_install])
+
+        for tool_name, install_func in tools_to_install:
+            try:
+                results[tool_name] = install_func()
+            except Exception as e:
+                logger.error("Unexpected error installing %s: %s", tool_name, e)
+                results[tool_name] = False
+            print()
 
     report_path = generate_installation_report(results)
 
@@ -335,5 +522,5 @@ if __name__ == "__main__":
         logger.warning("Installation interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         sys.exit(1)
@@ -3,6 +3,11 @@ import sys
 import os
 import subprocess
 import shutil
+import io
+import importlib.util
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -16,6 +21,22 @@ from paths import (
     DOWNLOADS_DIR,
 )
 
+if sys.platform.startswith('win'):
+    import ctypes
+
+    INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+    _GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+
+    def path_exists(path):
+        return _GetFileAttributesW(str(path)) != INVALID_FILE_ATTRIBUTES
+else:
+    path_exists = os.path.exists
+
+RUN_STARTED = datetime.now()
+RUN_ID = RUN_STARTED.strftime('%Y%m%d_%H%M%S')
+
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -25,22 +46,27 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+_output = threading.local()
+
+def _out():
+    return getattr(_output, "buffer", None)
+
 def print_header(text):
-    print(f"\n{Colors.CYAN}{Colors.BOLD}{'='*60}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}{text}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}{'='*60}{Colors.RESET}\n")
+    print(f"\n{Colors.CYAN}{Colors.BOLD}{'='*60}{Colors.RESET}", file=_out())
+    print(f"{Colors.CYAN}{Colors.BOLD}{text}{Colors.RESET}", file=_out())
+    print(f"{Colors.CYAN}{Colors.BOLD}{'='*60}{Colors.RESET}\n", file=_out())
 
 def print_success(text):
-    print(f"{Colors.GREEN}✓ {text}{Colors.RESET}")
+    print(f"{Colors.GREEN}✓ {text}{Colors.RESET}", file=_out())
 
 def print_error(text):
-    print(f"{Colors.RED}✗ {text}{Colors.RESET}")
+    print(f"{Colors.RED}✗ {text}{Colors.RESET}", file=_out())
 
 def print_warning(text):
-    print(f"{Colors.YELLOW}⚠ {text}{Colors.RESET}")
+    print(f"{Colors.YELLOW}⚠ {text}{Colors.RESET}", file=_out())
 
 def print_info(text):
-    print(f"{Colors.BLUE}ℹ {text}{Colors.RESET}")
+    print(f"{Colors.BLUE}ℹ {text}{Colors.RESET}", file=_out())
 
 def check_python_version():
     version = sys.version_info
@@ -51,12 +77,18 @@ def check_python_version():
         print_error(f"Python {version.major}.{version.minor}.{version.micro} (Requires 3.8+)")
         return False
 
-def check_python_package(package_name):
+@functools.lru_cache(maxsize=None)
+def _package_available(package_name):
     try:
-        __import__(package_name)
+        return importlib.util.find_spec(package_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def check_python_package(package_name):
+    if _package_available(package_name):
         print_success(f"Python package: {package_name}")
         return True
-    except ImportError:
+    else:
         print_error(f"Python package: {package_name} (Not installed)")
         return False
 
@@ -75,13 +107,45 @@ def check_file_exists(file_path, friendly_name=None):
     if friendly_name is None:
         friendly_name = file_path
 
-    if Path(file_path).exists():
+    if path_exists(file_path):
         print_success(f"File: {friendly_name}")
         return True
     else:
         print_error(f"File: {friendly_name} (Not found)")
         return False
 
+TOOLS_INVENTORY_DEPTH = 4
+
+@functools.lru_cache(maxsize=None)
+def _tools_inventory():
+    inventory = {}
+    for dirpath, dirnames, filenames in os.walk(TOOLS_DIR):
+        relative = Path(dirpath).relative_to(TOOLS_DIR)
+        for name in dirnames + filenames:
+            entry = (relative / name).as_posix()
+            inventory[entry.lower()] = entry
+        if len(relative.parts) + 1 >= TOOLS_INVENTORY_DEPTH:
+            dirnames.clear()
+    return inventory
+
+def _tool_path_exists(path):
+    return path.relative_to(TOOLS_DIR).as_posix().lower() in _tools_inventory()
+
+def _existing_directories(dir_paths):
+    listings = {}
+    existing = set()
+    for dir_path in dir_paths:
+        parent = dir_path.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries if entry.is_dir()}
+            except OSError:
+                listings[parent] = set()
+        if dir_path.name in listings[parent]:
+            existing.add(dir_path)
+    return existing
+
 def check_directory_structure():
     print_header("Checking Directory Structure")
 
@@ -93,9 +157,11 @@ def check_directory_structure():
         (REPORTS_DIR, "reports/"),
     ]
 
+    existing = _existing_directories(dir_path for dir_path, _ in required_dirs)
+
     results = []
     for dir_path, friendly_name in required_dirs:
-        if dir_path.exists():
+        if dir_path in existing:
             print_success(f"{friendly_name}: {dir_path}")
             results.append(True)
         else:
@@ -118,7 +184,7 @@ def check_memory_tools():
 
     winpmem_found = False
     for path in winpmem_paths:
-        if path.exists():
+        if _tool_path_exists(path):
             print_success(f"WinPMEM: {path}")
             winpmem_found = True
             break
@@ -142,7 +208,7 @@ def check_network_tools():
             Path("C:/Program Files (x86)/Wireshark/tshark.exe"),
         ]
         for path in common_tshark_paths:
-            if path.exists():
+            if path_exists(path):
                 tshark_path = str(path)
                 break
 
@@ -173,7 +239,7 @@ def check_process_tools():
 
     sysinternals_count = 0
     for path, name in sysinternals_tools:
-        if path.exists():
+        if _tool_path_exists(path):
             print_success(f"{name}: {path}")
             sysinternals_count += 1
         else:
@@ -193,7 +259,10 @@ def check_debugging_tools():
 
     results = []
 
-    ghidra_dirs = list((TOOLS_DIR / "ghidra").glob("ghidra_*"))
+    ghidra_dirs = sorted(
+        TOOLS_DIR / entry for key, entry in _tools_inventory().items()
+        if key.startswith("ghidra/ghidra_") and key.count("/") == 1
+    )
     if ghidra_dirs:
         print_success(f"Ghidra: {ghidra_dirs[0]}")
         results.append(True)
@@ -208,7 +277,7 @@ def check_debugging_tools():
 
     x64dbg_found = False
     for path in x64dbg_paths:
-        if path.exists():
+        if _tool_path_exists(path):
             print_success(f"x64dbg: {path}")
             x64dbg_found = True
             break
@@ -240,15 +309,32 @@ def check_python_dependencies():
 
     return results
 
+def _run_buffered(check):
+    _output.buffer = io.StringIO()
+    try:
+        return check(), _output.buffer.getvalue()
+    finally:
+        _output.buffer = None
+
+def run_checks_in_parallel(checks):
+    results = []
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 8)) as executor:
+        futures = [executor.submit(_run_buffered, check) for check in checks]
+        for future in futures:
+            result, output = future.result()
+            sys.stdout.write(output)
+            results.append(result)
+    return results
+
 def generate_report(all_results):
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
-    report_path = LOGS_DIR / f"verification_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    report_path = LOGS_DIR / f"verification_report_{RUN_ID}.txt"
 
     with open(report_path, 'w') as f:
         f.write("="*60 + "\n")
         f.write("INSTALLATION VERIFICATION REPORT\n")
         f.write("="*60 + "\n\n")
-        f.write(f"Verification Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Verification Date: {RUN_STARTED.strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write(f"Python Version: {sys.version}\n")
         f.write(f"Platform: {sys.platform}\n\n")
 
@@ -285,21 +371,19 @@ def main():
     print_header("Checking Python Environment")
     all_results.append(check_python_version())
 
-    check_directory_structure()
+    _, memory_ok, network_ok, process_ok, debugging_ok, python_deps = run_checks_in_parallel([
+        check_directory_structure,
+        check_memory_tools,
+        check_network_tools,
+        check_process_tools,
+        check_debugging_tools,
+        check_python_dependencies,
+    ])
 
-    memory_ok = check_memory_tools()
     all_results.append(memory_ok)
-
-    network_ok = check_network_tools()
     all_results.append(network_ok)
-
-    process_ok = check_process_tools()
     all_results.append(process_ok)
-
-    debugging_ok = check_debugging_tools()
     all_results.append(debugging_ok)
-
-    python_deps = check_python_dependencies()
     all_results.extend(python_deps)
 
     print_header("VERIFICATION SUMMARY")
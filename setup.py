@@ -31,7 +31,7 @@ setup(
     ],
     python_requires='>=3.10',
     install_requires=[
-        'psutil>=5.9.5',
+        'psutil>=6.0.0',
         'WMI>=1.5.1',
         'pywin32>=305',
     ],
@@ -39,11 +39,12 @@ setup(
         'dev': [
             'pytest>=7.4.0',
             'pytest-cov>=4.1.0',
+            'pytest-xdist>=3.3.0',
             'pylint>=2.17.0',
             'autopep8>=2.0.0',
         ],
         'build': [
-            'pyinstaller>=5.13.0',
+            'pyinstaller>=6.6.0',
         ],
         'full': [
             'volatility3>=2.5.0',
@@ -2,65 +2,77 @@
 import os
 import sys
 import subprocess
-import importlib.util
+import argparse
+import shutil
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 SRC_DIR = Path(__file__).parent
 
-def check_pyinstaller():
-    spec = importlib.util.find_spec("PyInstaller")
-    if spec is not None:
-        print("✓ PyInstaller is installed")
-        return True
-    else:
-        print("✗ PyInstaller not found")
-        print("  Installing PyInstaller...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-        print("✓ PyInstaller installed")
-        return True
+PIP_CACHE_DIR = Path(os.environ.get("BITPROBE_PIP_CACHE", PROJECT_ROOT / '.pip-cache'))
+WHEELHOUSE_DIR = PROJECT_ROOT / 'wheelhouse'
+DEPS_SENTINEL = PROJECT_ROOT / '.deps_ok'
+REQUIREMENTS_FILE = PROJECT_ROOT / 'requirements.txt'
 
-def create_spec_file():
+USE_UPX = os.environ.get("BITPROBE_UPX") == "1"
+ONEFILE = os.environ.get("BITPROBE_ONEFILE") == "1"
+RUNTIME_TMPDIR = r'%LOCALAPPDATA%\BitProbe\runtime'
 
-    forensic_master = str(SRC_DIR / 'forensic_master.py')
-    install_tools = str(SRC_DIR / 'install_tools.py')
-    capture_artifacts = str(SRC_DIR / 'capture_artifacts.py')
-    icon_path = str(PROJECT_ROOT / 'icon.ico') if (PROJECT_ROOT / 'icon.ico').exists() else None
-    icon_line = f"    icon=r'{icon_path}'," if icon_path else "    icon=None,"
+WORK_DIR = PROJECT_ROOT / 'build'
+DIST_DIR = PROJECT_ROOT / 'dist'
+SPEC_FILE = PROJECT_ROOT / 'BitProbe-Scan.spec'
+ENTRY_SCRIPT = SRC_DIR / 'forensic_master.py'
 
-    spec_content = f"""
+ICON_PATH = PROJECT_ROOT / 'icon.ico'
+ICON_LINE = f"    icon=r'{ICON_PATH}'," if ICON_PATH.exists() else "    icon=None,"
 
-block_cipher = None
+FINGERPRINT_FILE = DIST_DIR / '.build.fingerprint'
+BUILD_INPUTS = [
+    ENTRY_SCRIPT,
+    SRC_DIR / 'install_tools.py',
+    SRC_DIR / 'capture_artifacts.py',
+    SRC_DIR / 'yara_scanner.py',
+    SRC_DIR / 'paths.py',
+    ICON_PATH,
+    Path(__file__),
+]
 
-a = Analysis(
-    [r'{forensic_master}'],
-    pathex=[r'{SRC_DIR}'],
-    binaries=[],
-    datas=[
-        (r'{install_tools}', '.'),
-        (r'{capture_artifacts}', '.'),
-    ],
-    hiddenimports=[
-        'psutil',
-        'wmi',
-        'win32com',
-        'win32api',
-        'win32con',
-        'pywintypes',
-        'winreg',
-    ],
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
+EXCLUDED_MODULES = [
+    'tkinter',
+    'test',
+    'unittest',
+    'pydoc',
+    'distutils',
+    'setuptools',
+    'lib2to3',
+    'pip',
+    'wheel',
+    'email.test',
+    'xmlrpc',
+    'turtledemo',
+    'idlelib',
+]
 
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+PYINSTALLER_CMD = [sys.executable, '-OO', '-m', 'PyInstaller']
+BUILD_ENV = {**os.environ, 'PYTHONDONTWRITEBYTECODE': '1', 'PYTHONHASHSEED': '0'}
+if shutil.which('ccache'):
+    BUILD_ENV.setdefault('CC', 'ccache gcc')
+    BUILD_ENV.setdefault('CXX', 'ccache g++')
+
+if os.name == 'nt' and not (sys.stdout and sys.stdout.isatty()):
+    CREATE_FLAGS = subprocess.CREATE_NO_WINDOW
+else:
+    CREATE_FLAGS = 0
+
+if ONEFILE:
+    EXE_PATH = DIST_DIR / 'BitProbe-Scan.exe'
+else:
+    EXE_PATH = DIST_DIR / 'BitProbe-Scan' / 'BitProbe-Scan.exe'
 
+ONEFILE_BUNDLE_TEMPLATE = """
 exe = EXE(
     pyz,
     a.scripts,
@@ -72,9 +84,30 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx={upx},
+    runtime_tmpdir=r'{runtime_tmpdir}',
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+{icon_line}
+    uac_admin=True,
+)
+"""
+
+ONEDIR_BUNDLE_TEMPLATE = """
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='BitProbe-Scan',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx={upx},
     console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -84,103 +117,239 @@ exe = EXE(
 {icon_line}
     uac_admin=True,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx={upx},
+    upx_exclude=[],
+    name='BitProbe-Scan',
+)
 """
 
-    spec_file = PROJECT_ROOT / 'forensic_tool.spec'
-    with open(spec_file, 'w') as f:
-        f.write(spec_content)
+SPEC_TEMPLATE = """
+
+block_cipher = None
+
+a = Analysis(
+    [r'{forensic_master}'],
+    pathex=[r'{src_dir}'],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes={excludes!r},
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=True,
+    optimize=2,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+""" + (ONEFILE_BUNDLE_TEMPLATE if ONEFILE else ONEDIR_BUNDLE_TEMPLATE)
+
+def _deps_sentinel_fresh():
+    try:
+        return DEPS_SENTINEL.stat().st_mtime >= REQUIREMENTS_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+def _run_pip(args):
+    try:
+        from pip._internal.cli.main import main as pip_main
+        status = pip_main(args)
+    except Exception:
+        subprocess.check_call([sys.executable, "-m", "pip", *args])
+        return
+    if status != 0:
+        raise subprocess.CalledProcessError(status, ["pip", *args])
+
+@functools.lru_cache(maxsize=None)
+def check_pyinstaller():
+    if _deps_sentinel_fresh():
+        print("✓ PyInstaller check cached")
+        return True
+
+    try:
+        import PyInstaller  # noqa: F401
+        print("✓ PyInstaller is installed")
+    except ImportError:
+        print("✗ PyInstaller not found")
+        print("  Installing PyInstaller...")
+        pip_args = [
+            "install",
+            "--prefer-binary",
+            "--cache-dir", str(PIP_CACHE_DIR),
+        ]
+        if WHEELHOUSE_DIR.is_dir():
+            pip_args += ["--find-links", str(WHEELHOUSE_DIR)]
+        _run_pip([*pip_args, "pyinstaller"])
+        print("✓ PyInstaller installed")
+
+    DEPS_SENTINEL.touch()
+    return True
 
+def _inputs_fingerprint():
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(f"upx={USE_UPX};onefile={ONEFILE}".encode())
+    for path in BUILD_INPUTS:
+        digest.update(path.name.encode())
+        try:
+            digest.update(path.read_bytes())
+        except FileNotFoundError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+def _build_up_to_date(fingerprint):
+    try:
+        return EXE_PATH.exists() and FINGERPRINT_FILE.read_text() == fingerprint
+    except FileNotFoundError:
+        return False
+
+def create_spec_file():
+    spec_content = SPEC_TEMPLATE.format(
+        forensic_master=ENTRY_SCRIPT,
+        src_dir=SRC_DIR,
+        excludes=EXCLUDED_MODULES,
+        upx=USE_UPX,
+        icon_line=ICON_LINE,
+        runtime_tmpdir=RUNTIME_TMPDIR,
+    ).encode()
+
+    try:
+        if SPEC_FILE.read_bytes() == spec_content:
+            print("✓ Spec file unchanged")
+            return
+    except FileNotFoundError:
+        pass
+
+    SPEC_FILE.write_bytes(spec_content)
     print("✓ Spec file created")
 
-def build_executable():
+def build_executable(clean=False):
     print("\n" + "="*60)
     print("Building Forensic Analysis Tool Executable")
     print("="*60 + "\n")
 
-    if not check_pyinstaller():
-        print("✗ Failed to install PyInstaller")
-        return False
+    fingerprint = _inputs_fingerprint()
+    if not clean and _build_up_to_date(fingerprint):
+        print(f"✓ Executable is up-to-date: {EXE_PATH}")
+        return True
+
+    if clean:
+        DEPS_SENTINEL.unlink(missing_ok=True)
+        check_pyinstaller.cache_clear()
 
-    create_spec_file()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pyinstaller_ready = executor.submit(check_pyinstaller)
+        spec_written = executor.submit(create_spec_file)
+        spec_written.result()
+        if not pyinstaller_ready.result():
+            print("✗ Failed to install PyInstaller")
+            return False
 
     print("\nBuilding executable (this may take a few minutes)...")
 
     try:
-        spec_file = PROJECT_ROOT / 'forensic_tool.spec'
         cmd = [
-            'pyinstaller',
-            '--clean',
+            *PYINSTALLER_CMD,
             '--noconfirm',
-            str(spec_file)
+            '--workpath', str(WORK_DIR),
+            '--distpath', str(DIST_DIR),
         ]
+        if clean:
+            cmd.append('--clean')
+        cmd.append(str(SPEC_FILE))
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=PROJECT_ROOT)
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT, env=BUILD_ENV,
+                                creationflags=CREATE_FLAGS, check=False)
 
         if result.returncode == 0:
-            exe_path = PROJECT_ROOT / 'dist' / 'BitProbe-Scan.exe'
-            if exe_path.exists():
-                size_mb = exe_path.stat().st_size / (1024*1024)
-                print(f"\n{'='*60}")
-                print("✓ BUILD SUCCESSFUL!")
-                print(f"{'='*60}")
-                print(f"\nExecutable Location: {exe_path.absolute()}")
-                print(f"File Size: {size_mb:.2f} MB")
-                print(f"\nUsage:")
-                print(f"  1. Copy BitProbe-Scan.exe to target system")
-                print(f"  2. Run as Administrator")
-                print(f"  3. All dependencies will be installed automatically")
-                print(f"  4. Artifacts and reports will be generated")
-                return True
-            else:
+            exe_path = EXE_PATH
+            try:
+                size_mb = os.stat(exe_path).st_size / (1024*1024)
+            except FileNotFoundError:
                 print("✗ Executable not found after build")
                 return False
+            FINGERPRINT_FILE.write_text(fingerprint)
+            print(f"\n{'='*60}")
+            print("✓ BUILD SUCCESSFUL!")
+            print(f"{'='*60}")
+            print(f"\nExecutable Location: {exe_path.absolute()}")
+            print(f"File Size: {size_mb:.2f} MB")
+            print(f"\nUsage:")
+            if ONEFILE:
+                print(f"  1. Copy BitProbe-Scan.exe to target system")
+            else:
+                print(f"  1. Copy the {exe_path.parent.name} folder to target system")
+            print(f"  2. Run as Administrator")
+            print(f"  3. All dependencies will be installed automatically")
+            print(f"  4. Artifacts and reports will be generated")
+            return True
         else:
-            print(f"✗ Build failed")
-            print(f"Error: {result.stderr}")
+            print(f"✗ Build failed (exit code {result.returncode})")
             return False
 
     except Exception as e:
         print(f"✗ Build error: {e}")
         return False
 
-def create_simple_build():
+def create_simple_build(clean=False):
     print("\nAttempting simple build...")
 
-    forensic_master = SRC_DIR / 'forensic_master.py'
-    install_tools = SRC_DIR / 'install_tools.py'
-    capture_artifacts = SRC_DIR / 'capture_artifacts.py'
-
     cmd = [
-        'pyinstaller',
-        '--onefile',
+        *PYINSTALLER_CMD,
+        '--noconfirm',
+        '--workpath', str(WORK_DIR),
+        '--distpath', str(DIST_DIR),
+        '--specpath', str(WORK_DIR),
+        '--paths', str(SRC_DIR),
+        '--onefile' if ONEFILE else '--onedir',
         '--name=BitProbe-Scan',
         '--uac-admin',
         '--console',
-        '--clean',
-        '--add-data', f'{install_tools};.',
-        '--add-data', f'{capture_artifacts};.',
-        '--hidden-import=psutil',
-        '--hidden-import=wmi',
-        '--hidden-import=win32com',
-        '--hidden-import=winreg',
-        str(forensic_master)
+        '--optimize=2',
+        '--debug=noarchive',
+        *[f'--exclude-module={module}' for module in EXCLUDED_MODULES],
+        str(ENTRY_SCRIPT)
     ]
+    if ONEFILE:
+        cmd.insert(len(PYINSTALLER_CMD), f'--runtime-tmpdir={RUNTIME_TMPDIR}')
+    if clean:
+        cmd.insert(len(PYINSTALLER_CMD), '--clean')
+    if not USE_UPX:
+        cmd.insert(len(PYINSTALLER_CMD), '--noupx')
 
     try:
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=PROJECT_ROOT)
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT, env=BUILD_ENV,
+                                creationflags=CREATE_FLAGS, check=False)
 
         if result.returncode == 0:
             print("✓ Simple build successful")
             return True
         else:
-            print(f"✗ Simple build failed: {result.stderr}")
+            print(f"✗ Simple build failed (exit code {result.returncode})")
             return False
     except Exception as e:
         print(f"✗ Error: {e}")
         return False
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(description="Build the BitProbe-Scan executable")
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Discard PyInstaller's cached build state and rebuild from scratch.",
+    )
+    args = parser.parse_args()
+
     print("""
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
@@ -189,11 +358,11 @@ if __name__ == "__main__":
 ╚══════════════════════════════════════════════════════════════╝
     """)
 
-    success = build_executable()
+    success = build_executable(clean=args.clean)
 
     if not success:
         print("\nTrying alternative build method...")
-        success = create_simple_build()
+        success = create_simple_build(clean=args.clean)
 
     if success:
         print("\n✓ Build complete! Check the 'dist' folder.")
@@ -203,5 +372,9 @@ if __name__ == "__main__":
         print("  1. Ensure all Python scripts are in the src/ directory")
         print("  2. Install missing packages: pip install -r requirements.txt")
         print("  3. Try running from project root: python src/build_executable.py")
+        print("  4. Force a full rebuild: python src/build_executable.py --clean")
+
+    return 0 if success else 1
 
-    sys.exit(0 if success else 1)
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,19 @@
 import os
 import sys
 import subprocess
+import io
 import json
 import time
+import atexit
+import queue
+import threading
+import ctypes
+import hashlib
+import functools
+import mmap
+import re
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from paths import ARTIFACTS_DIR, INDIVIDUAL_REPORTS_DIR, TOOLS_DIR
@@ -19,13 +30,83 @@ import logging
 import winreg
 import sqlite3
 import shutil
+import tempfile
 
 logger = logging.getLogger(__name__)
 
 REPORTS_DIR = INDIVIDUAL_REPORTS_DIR
 
+SEP = "=" * 80 + "\n"
+
+ARTIFACT_SUBDIRS = ['processes', 'network', 'registry', 'browser', 'memory', 'ghidra']
+
+FAMILY_NAMES = {socket.AF_INET: 'IPv4', socket.AF_INET6: 'IPv6'}
+SOCKET_TYPE_NAMES = {socket.SOCK_STREAM: 'TCP', socket.SOCK_DGRAM: 'UDP'}
+
+_registry_handles = {}
+_run_timestamp = None
+_run_capture_time = None
+
+class AsyncArtifactWriter:
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, path, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, name="artifact-writer", daemon=True)
+                self._thread.start()
+        self._queue.put((path, data))
+
+    def flush(self):
+        self._queue.join()
+
+    def _drain(self):
+        while True:
+            path, data = self._queue.get()
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.error(f"Error writing artifact {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+artifact_writer = AsyncArtifactWriter()
+atexit.register(artifact_writer.flush)
+
+@functools.lru_cache(maxsize=None)
+def _dir_entries(directory):
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(os.path.normcase(entry.name) for entry in entries)
+    except OSError:
+        return frozenset()
+
+def _tool_exists(path):
+    path = Path(path)
+    return os.path.normcase(path.name) in _dir_entries(str(path.parent))
+
 def get_timestamp():
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return _run_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+
+def _capture_time():
+    return _run_capture_time or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+def _write_header(f, title):
+    f.write(SEP)
+    f.write(f"{title}\n")
+    f.write(SEP + "\n")
 
 def capture_running_processes():
     logger.info("Capturing running processes...")
@@ -37,7 +118,7 @@ def capture_running_processes():
     processes = []
 
     try:
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'status', 'create_time', 'memory_info', 'cpu_percent']):
+        for proc in psutil.process_iter(['pid', 'name', 'username', 'status', 'create_time', 'memory_info']):
             try:
                 pinfo = proc.info
                 processes.append({
@@ -45,36 +126,36 @@ def capture_running_processes():
                     'name': pinfo['name'],
                     'username': pinfo['username'] or 'N/A',
                     'status': pinfo['status'],
-                    'created': datetime.fromtimestamp(pinfo['create_time']).strftime('%Y-%m-%d %H:%M:%S') if pinfo['create_time'] else 'N/A',
-                    'memory_mb': round(pinfo['memory_info'].rss / (1024*1024), 2) if pinfo['memory_info'] else 0,
-                    'cpu_percent': pinfo['cpu_percent']
+                    'created': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(pinfo['create_time'])) if pinfo['create_time'] else 'N/A',
+                    'memory_mb': round(pinfo['memory_info'].rss / (1024*1024), 2) if pinfo['memory_info'] else 0
                 })
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
 
-        with open(artifact_file, 'w') as f:
-            f.write(json.dumps(processes, indent=2))
+        artifact_writer.enqueue(artifact_file, json.dumps(processes))
 
-        with open(report_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("RUNNING PROCESSES REPORT\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Processes: {len(processes)}\n\n")
+        buf = io.StringIO()
+        _write_header(buf, "RUNNING PROCESSES REPORT")
+        buf.write(f"Capture Time: {_capture_time()}\n")
+        buf.write(f"Total Processes: {len(processes)}\n\n")
 
-            f.write("-"*80 + "\n")
-            f.write(f"{'PID':<8} {'Name':<30} {'User':<20} {'Memory (MB)':<12} {'Status':<10}\n")
-            f.write("-"*80 + "\n")
+        buf.write("-"*80 + "\n")
+        buf.write(f"{'PID':<8} {'Name':<30} {'User':<20} {'Memory (MB)':<12} {'Status':<10}\n")
+        buf.write("-"*80 + "\n")
 
-            for proc in sorted(processes, key=lambda x: x['memory_mb'], reverse=True)[:50]:
-                f.write(f"{proc['pid']:<8} {proc['name']:<30} {proc['username']:<20} {proc['memory_mb']:<12.2f} {proc['status']:<10}\n")
+        by_memory = sorted(processes, key=lambda x: x['memory_mb'], reverse=True)[:50]
+        for proc in by_memory:
+            buf.write(f"{proc['pid']:<8} {proc['name']:<30} {proc['username']:<20} {proc['memory_mb']:<12.2f} {proc['status']:<10}\n")
 
-            f.write("\n" + "="*80 + "\n")
-            f.write("Top 10 Memory Consumers:\n")
-            f.write("-"*80 + "\n")
+        buf.write("\n" + SEP)
+        buf.write("Top 10 Memory Consumers:\n")
+        buf.write("-"*80 + "\n")
 
-            for idx, proc in enumerate(sorted(processes, key=lambda x: x['memory_mb'], reverse=True)[:10], 1):
-                f.write(f"{idx}. {proc['name']} (PID: {proc['pid']}) - {proc['memory_mb']} MB\n")
+        for idx, proc in enumerate(by_memory[:10], 1):
+            buf.write(f"{idx}. {proc['name']} (PID: {proc['pid']}) - {proc['memory_mb']} MB\n")
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(buf.getvalue())
 
         logger.info(f"Process list captured: {len(processes)} processes")
         return report_file
@@ -92,45 +173,48 @@ def capture_network_connections():
 
     try:
         connections = []
+        tcp_conns = []
+        udp_conns = []
 
         for conn in psutil.net_connections(kind='inet'):
             try:
-                connections.append({
-                    'family': 'IPv4' if conn.family == 2 else 'IPv6',
-                    'type': 'TCP' if conn.type == 1 else 'UDP',
+                conn_type = SOCKET_TYPE_NAMES[conn.type]
+                entry = {
+                    'family': FAMILY_NAMES[conn.family],
+                    'type': conn_type,
                     'local_addr': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else 'N/A',
                     'remote_addr': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else 'N/A',
                     'status': conn.status,
                     'pid': conn.pid
-                })
+                }
             except:
                 continue
+            connections.append(entry)
+            (tcp_conns if conn_type == 'TCP' else udp_conns).append(entry)
 
-        with open(artifact_file, 'w') as f:
-            f.write(json.dumps(connections, indent=2))
+        artifact_writer.enqueue(artifact_file, json.dumps(connections))
 
-        with open(report_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("NETWORK CONNECTIONS REPORT\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Connections: {len(connections)}\n\n")
+        buf = io.StringIO()
+        _write_header(buf, "NETWORK CONNECTIONS REPORT")
+        buf.write(f"Capture Time: {_capture_time()}\n")
+        buf.write(f"Total Connections: {len(connections)}\n\n")
 
-            tcp_conns = [c for c in connections if c['type'] == 'TCP']
-            f.write(f"TCP Connections: {len(tcp_conns)}\n")
-            f.write("-"*80 + "\n")
-            f.write(f"{'Type':<8} {'Local Address':<30} {'Remote Address':<30} {'Status':<15}\n")
-            f.write("-"*80 + "\n")
+        buf.write(f"TCP Connections: {len(tcp_conns)}\n")
+        buf.write("-"*80 + "\n")
+        buf.write(f"{'Type':<8} {'Local Address':<30} {'Remote Address':<30} {'Status':<15}\n")
+        buf.write("-"*80 + "\n")
 
-            for conn in tcp_conns[:30]:
-                f.write(f"{conn['type']:<8} {conn['local_addr']:<30} {conn['remote_addr']:<30} {conn['status']:<15}\n")
+        for conn in tcp_conns[:30]:
+            buf.write(f"{conn['type']:<8} {conn['local_addr']:<30} {conn['remote_addr']:<30} {conn['status']:<15}\n")
 
-            udp_conns = [c for c in connections if c['type'] == 'UDP']
-            f.write(f"\nUDP Connections: {len(udp_conns)}\n")
-            f.write("-"*80 + "\n")
+        buf.write(f"\nUDP Connections: {len(udp_conns)}\n")
+        buf.write("-"*80 + "\n")
 
-            for conn in udp_conns[:20]:
-                f.write(f"{conn['type']:<8} {conn['local_addr']:<30} {conn['remote_addr']:<30}\n")
+        for conn in udp_conns[:20]:
+            buf.write(f"{conn['type']:<8} {conn['local_addr']:<30} {conn['remote_addr']:<30}\n")
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(buf.getvalue())
 
         logger.info(f"Network connections captured: {len(connections)} connections")
         return report_file
@@ -139,6 +223,22 @@ def capture_network_connections():
         logger.error(f"Error capturing network connections: {e}")
         return None
 
+EVENT_LOG_CHANNELS = ['System', 'Security', 'Application']
+EVENT_LOG_ENTRIES = 50
+
+def _query_event_log(log_name):
+    try:
+        cmd = ['wevtutil', 'qe', log_name, f'/c:{EVENT_LOG_ENTRIES}', '/rd:true', '/f:text']
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+
+        if result.returncode != 0:
+            return f"Error capturing {log_name} log: {result.stderr}\n"
+        return result.stdout or "No entries found\n"
+    except subprocess.TimeoutExpired:
+        return f"Timeout while capturing {log_name} log\n"
+    except Exception as e:
+        return f"Error: {e}\n"
+
 def capture_system_logs():
     logger.info("Capturing system logs...")
 
@@ -147,32 +247,18 @@ def capture_system_logs():
 
     try:
 
-        logs_to_capture = ['System', 'Security', 'Application']
-
-        with open(report_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("SYSTEM LOGS REPORT\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            for log_name in logs_to_capture:
-                f.write(f"\n{'='*80}\n")
-                f.write(f"{log_name.upper()} LOG (Last 50 entries)\n")
-                f.write(f"{'='*80}\n\n")
+        with ThreadPoolExecutor(max_workers=len(EVENT_LOG_CHANNELS)) as executor:
+            log_outputs = executor.map(_query_event_log, EVENT_LOG_CHANNELS)
 
-                try:
-
-                    cmd = f'wevtutil qe {log_name} /c:50 /rd:true /f:text'
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
+            with open(report_file, 'w', encoding='utf-8') as f:
+                _write_header(f, "SYSTEM LOGS REPORT")
+                f.write(f"Capture Time: {_capture_time()}\n\n")
 
-                    if result.returncode == 0:
-                        f.write(result.stdout)
-                    else:
-                        f.write(f"Error capturing {log_name} log: {result.stderr}\n")
-                except subprocess.TimeoutExpired:
-                    f.write(f"Timeout while capturing {log_name} log\n")
-                except Exception as e:
-                    f.write(f"Error: {e}\n")
+                for log_name, output in zip(EVENT_LOG_CHANNELS, log_outputs):
+                    f.write("\n" + SEP)
+                    f.write(f"{log_name.upper()} LOG (Last {EVENT_LOG_ENTRIES} entries)\n")
+                    f.write(SEP + "\n")
+                    f.write(output)
 
         logger.info("System logs captured")
         return report_file
@@ -181,6 +267,22 @@ def capture_system_logs():
         logger.error(f"Error capturing system logs: {e}")
         return None
 
+def _open_registry_key(hive, path):
+    key = _registry_handles.get((hive, path))
+    if key is None:
+        key = winreg.OpenKey(hive, path, 0, winreg.KEY_READ)
+        _registry_handles[(hive, path)] = key
+    return key
+
+@atexit.register
+def _close_registry_handles():
+    for key in _registry_handles.values():
+        try:
+            winreg.CloseKey(key)
+        except OSError:
+            pass
+    _registry_handles.clear()
+
 def capture_registry_artifacts():
     logger.info("Capturing registry artifacts...")
 
@@ -200,51 +302,45 @@ def capture_registry_artifacts():
 
         for key_name, (hive, path) in registry_keys.items():
             try:
-                key = winreg.OpenKey(hive, path, 0, winreg.KEY_READ)
+                key = _open_registry_key(hive, path)
                 values = []
 
-                i = 0
-                while True:
-                    try:
-                        name, value, type_ = winreg.EnumValue(key, i)
-                        values.append({
-                            'name': name,
-                            'value': str(value),
-                            'type': type_
-                        })
-                        i += 1
-                    except OSError:
-                        break
+                for i in range(winreg.QueryInfoKey(key)[1]):
+                    name, value, type_ = winreg.EnumValue(key, i)
+                    values.append({
+                        'name': name,
+                        'value': str(value),
+                        'type': type_
+                    })
 
                 registry_data[key_name] = values
-                winreg.CloseKey(key)
             except FileNotFoundError:
                 registry_data[key_name] = []
             except Exception as e:
                 logger.error(f"Error reading {key_name}: {e}")
                 registry_data[key_name] = []
 
-        with open(artifact_file, 'w') as f:
-            f.write(json.dumps(registry_data, indent=2))
+        artifact_writer.enqueue(artifact_file, json.dumps(registry_data))
 
-        with open(report_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("REGISTRY ARTIFACTS REPORT\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        buf = io.StringIO()
+        _write_header(buf, "REGISTRY ARTIFACTS REPORT")
+        buf.write(f"Capture Time: {_capture_time()}\n\n")
 
-            for key_name, values in registry_data.items():
-                f.write(f"\n{'-'*80}\n")
-                f.write(f"{key_name}\n")
-                f.write(f"{'-'*80}\n")
-
-                if values:
-                    for item in values:
-                        f.write(f"Name: {item['name']}\n")
-                        f.write(f"Value: {item['value']}\n")
-                        f.write(f"Type: {item['type']}\n\n")
-                else:
-                    f.write("No entries found\n\n")
+        for key_name, values in registry_data.items():
+            buf.write(f"\n{'-'*80}\n")
+            buf.write(f"{key_name}\n")
+            buf.write(f"{'-'*80}\n")
+
+            if values:
+                for item in values:
+                    buf.write(f"Name: {item['name']}\n")
+                    buf.write(f"Value: {item['value']}\n")
+                    buf.write(f"Type: {item['type']}\n\n")
+            else:
+                buf.write("No entries found\n\n")
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(buf.getvalue())
 
         logger.info("Registry artifacts captured")
         return report_file
@@ -253,6 +349,89 @@ def capture_registry_artifacts():
         logger.error(f"Error capturing registry artifacts: {e}")
         return None
 
+LARGE_COPY_THRESHOLD = 8 * 1024 * 1024
+
+def _copy_file(src, dst):
+    if os.name == 'nt' and os.path.getsize(src) > LARGE_COPY_THRESHOLD:
+        cancelled = ctypes.c_int(0)
+        if not ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, ctypes.byref(cancelled), 0):
+            raise ctypes.WinError()
+    else:
+        shutil.copy(src, dst)
+
+HISTORY_ROW_LIMIT = 100
+
+def _fetch_history(conn, query):
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    cursor = conn.execute(query)
+    cursor.arraysize = HISTORY_ROW_LIMIT
+    return cursor.fetchmany()
+
+def _query_readonly(db_path, query):
+    conn = sqlite3.connect(
+        f"{Path(db_path).absolute().as_uri()}?mode=ro&immutable=1",
+        uri=True,
+        isolation_level=None,
+        cached_statements=0
+    )
+    try:
+        return _fetch_history(conn, query)
+    finally:
+        conn.close()
+
+def _query_history_db(db_path, temp_db, query):
+    try:
+        return _query_readonly(db_path, query)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not read {db_path} in place ({e}), reading a snapshot instead")
+
+    temp_db = Path(temp_db)
+    temp_db.parent.mkdir(parents=True, exist_ok=True)
+    fd, snapshot = tempfile.mkstemp(prefix=f"{temp_db.stem}_", suffix=temp_db.suffix, dir=temp_db.parent)
+    os.close(fd)
+    try:
+        _copy_file(db_path, snapshot)
+        return _query_readonly(snapshot, query)
+    finally:
+        os.unlink(snapshot)
+
+def _load_capture_cache():
+    try:
+        return json.loads((ARTIFACTS_DIR / ".cache.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def _update_capture_cache(section, data):
+    cache = _load_capture_cache()
+    cache[section] = data
+    try:
+        (ARTIFACTS_DIR / ".cache.json").write_text(json.dumps(cache), encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"Could not update capture cache: {e}")
+
+def _cached_history(cache, db_path, temp_db, query):
+    stat = os.stat(db_path)
+    entry = cache.get(str(db_path))
+    if (entry and entry.get('captured_at') and entry['mtime_ns'] == stat.st_mtime_ns
+            and entry['size'] == stat.st_size):
+        logger.info(f"{db_path} unchanged since capture at {entry['captured_at']}, reusing cached history")
+        return entry['rows'], entry['captured_at']
+
+    rows = [
+        {'url': r[0], 'title': r[1], 'visits': r[2], 'last_visit': r[3]}
+        for r in _query_history_db(db_path, temp_db, query)
+    ]
+    cache[str(db_path)] = {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'captured_at': _capture_time(),
+        'rows': rows,
+    }
+    return rows, None
+
 def capture_browser_history():
     logger.info("Capturing browser history...")
 
@@ -267,6 +446,8 @@ def capture_browser_history():
         }
 
         all_history = {}
+        reused_from = {}
+        history_cache = _load_capture_cache().get('browser_history', {})
 
         for browser, path in browser_paths.items():
             try:
@@ -276,50 +457,43 @@ def capture_browser_history():
                         for profile in path.glob('*.default*'):
                             history_db = profile / 'places.sqlite'
                             if history_db.exists():
-                                temp_db = ARTIFACTS_DIR / "browser" / f"firefox_temp_{timestamp}.sqlite"
-                                shutil.copy(history_db, temp_db)
-
-                                conn = sqlite3.connect(temp_db)
-                                cursor = conn.cursor()
-                                cursor.execute("SELECT url, title, visit_count, last_visit_date FROM moz_places ORDER BY last_visit_date DESC LIMIT 100")
-                                results = cursor.fetchall()
-                                conn.close()
-
-                                all_history[f'Firefox ({profile.name})'] = [
-                                    {'url': r[0], 'title': r[1], 'visits': r[2], 'last_visit': r[3]}
-                                    for r in results
-                                ]
+                                temp_db = ARTIFACTS_DIR / "browser" / f"firefox_{profile.name}_temp_{timestamp}.sqlite"
+                                label = f'Firefox ({profile.name})'
+                                all_history[label], reused_from[label] = _cached_history(
+                                    history_cache,
+                                    history_db,
+                                    temp_db,
+                                    f"SELECT url, title, visit_count, last_visit_date FROM moz_places ORDER BY last_visit_date DESC LIMIT {HISTORY_ROW_LIMIT}"
+                                )
                 else:
 
                     if path.exists():
                         temp_db = ARTIFACTS_DIR / "browser" / f"{browser.lower()}_temp_{timestamp}.sqlite"
-                        shutil.copy(path, temp_db)
-
-                        conn = sqlite3.connect(temp_db)
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT url, title, visit_count, last_visit_time FROM urls ORDER BY last_visit_time DESC LIMIT 100")
-                        results = cursor.fetchall()
-                        conn.close()
-
-                        all_history[browser] = [
-                            {'url': r[0], 'title': r[1], 'visits': r[2], 'last_visit': r[3]}
-                            for r in results
-                        ]
+                        all_history[browser], reused_from[browser] = _cached_history(
+                            history_cache,
+                            path,
+                            temp_db,
+                            f"SELECT url, title, visit_count, last_visit_time FROM urls ORDER BY last_visit_time DESC LIMIT {HISTORY_ROW_LIMIT}"
+                        )
             except Exception as e:
                 logger.error(f"Error capturing {browser} history: {e}")
                 all_history[browser] = []
 
+        _update_capture_cache('browser_history', history_cache)
+
         with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("BROWSER HISTORY REPORT\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            _write_header(f, "BROWSER HISTORY REPORT")
+            f.write(f"Capture Time: {_capture_time()}\n\n")
 
             for browser, history in all_history.items():
                 f.write(f"\n{'-'*80}\n")
                 f.write(f"{browser} (Last 100 entries)\n")
                 f.write(f"{'-'*80}\n\n")
 
+                if reused_from.get(browser):
+                    f.write(f"Note: database unchanged since capture at {reused_from[browser]}; "
+                            f"entries below were reused from that capture, not re-read in this run\n\n")
+
                 if history:
                     for idx, entry in enumerate(history[:50], 1):
                         f.write(f"{idx}. {entry['title'] or 'No Title'}\n")
@@ -335,6 +509,15 @@ def capture_browser_history():
         logger.error(f"Error capturing browser history: {e}")
         return None
 
+def _sha256_file(path):
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
 def create_memory_dump():
     logger.info("Creating memory dump...")
 
@@ -346,32 +529,29 @@ def create_memory_dump():
 
         winpmem_path = TOOLS_DIR / "winpmem" / "winpmem_mini_x64_rc2.exe"
 
-        if not winpmem_path.exists():
+        if not _tool_exists(winpmem_path):
             logger.warning("WinPMEM not found, skipping memory dump")
-            with open(report_file, 'w') as f:
-                f.write("="*80 + "\n")
-                f.write("MEMORY DUMP REPORT\n")
-                f.write("="*80 + "\n\n")
+            with open(report_file, 'w', encoding='utf-8') as f:
+                _write_header(f, "MEMORY DUMP REPORT")
                 f.write("Status: Skipped (WinPMEM not installed)\n")
             return report_file
 
         logger.info("Creating memory dump (this may take several minutes)...")
-        cmd = f'"{winpmem_path}" "{dump_file}"'
+        cmd = [str(winpmem_path), str(dump_file)]
 
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=1800)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)
 
         with open(report_file, 'w', encoding='utf-8', errors='ignore') as f:
-            f.write("="*80 + "\n")
-            f.write("MEMORY DUMP REPORT\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Command: {cmd}\n\n")
+            _write_header(f, "MEMORY DUMP REPORT")
+            f.write(f"Capture Time: {_capture_time()}\n")
+            f.write(f"Command: {subprocess.list2cmdline(cmd)}\n\n")
 
             if result.returncode == 0 and dump_file.exists():
                 dump_size_mb = dump_file.stat().st_size / (1024*1024)
                 f.write(f"Status: Success\n")
                 f.write(f"Dump File: {dump_file}\n")
                 f.write(f"Size: {dump_size_mb:.2f} MB\n")
+                f.write(f"SHA-256: {_sha256_file(dump_file)}\n")
                 logger.info(f"Memory dump created: {dump_size_mb:.2f} MB")
             else:
                 f.write(f"Status: Failed\n")
@@ -391,6 +571,39 @@ def create_memory_dump():
         logger.error(f"Error creating memory dump: {e}")
         return None
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+def _stream_command(cmd, sink, timeout, stderr=subprocess.STDOUT):
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, bufsize=STREAM_CHUNK_SIZE) as proc:
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.start()
+        try:
+            for chunk in iter(lambda: proc.stdout.read(STREAM_CHUNK_SIZE), b''):
+                sink(chunk)
+            proc.wait()
+        finally:
+            watchdog.cancel()
+    return proc.returncode
+
+def _count_packets(tshark_path, pcap_file):
+    capinfos_name = 'capinfos.exe' if os.name == 'nt' else 'capinfos'
+    capinfos_path = Path(tshark_path).with_name(capinfos_name)
+    if not _tool_exists(capinfos_path):
+        capinfos_path = shutil.which('capinfos')
+
+    if capinfos_path:
+        result = subprocess.run([str(capinfos_path), '-M', '-c', str(pcap_file)], capture_output=True, text=True, timeout=30)
+        match = re.search(r'Number of packets:\s+(\d+)', result.stdout)
+        if result.returncode == 0 and match:
+            return int(match.group(1))
+
+    count_cmd = [tshark_path, '-r', str(pcap_file), '-T', 'fields', '-e', 'frame.number']
+    line_counts = []
+    returncode = _stream_command(count_cmd, lambda chunk: line_counts.append(chunk.count(b'\n')), 30, stderr=subprocess.DEVNULL)
+    if returncode == 0:
+        return sum(line_counts)
+    return 0
+
 def capture_network_traffic(duration=60):
     logger.info("Capturing network traffic with TShark...")
 
@@ -408,17 +621,15 @@ def capture_network_traffic(duration=60):
                 Path("C:/Program Files (x86)/Wireshark/tshark.exe"),
             ]
             for path in common_paths:
-                if path.exists():
+                if _tool_exists(path):
                     tshark_path = str(path)
                     logger.info(f"Found tshark at: {tshark_path}")
                     break
 
         if not tshark_path:
             logger.warning("TShark not found in PATH or common locations, skipping network capture")
-            with open(report_file, 'w') as f:
-                f.write("="*80 + "\n")
-                f.write("NETWORK TRAFFIC CAPTURE REPORT\n")
-                f.write("="*80 + "\n\n")
+            with open(report_file, 'w', encoding='utf-8') as f:
+                _write_header(f, "NETWORK TRAFFIC CAPTURE REPORT")
                 f.write("Status: Skipped (TShark/Wireshark not installed or not in PATH)\n")
                 f.write("Please ensure Wireshark is installed and tshark.exe is in your PATH\n")
                 f.write("Or install Wireshark using the tool installation script\n")
@@ -436,18 +647,12 @@ def capture_network_traffic(duration=60):
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration+30)
 
         packet_count = 0
-        if pcap_file.exists() and pcap_file.stat().st_size > 0:
-
-            count_cmd = [tshark_path, '-r', str(pcap_file), '-T', 'fields', '-e', 'frame.number']
-            count_result = subprocess.run(count_cmd, capture_output=True, text=True, timeout=30)
-            if count_result.returncode == 0:
-                packet_count = len([line for line in count_result.stdout.strip().split('\n') if line])
-
-        with open(report_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("NETWORK TRAFFIC CAPTURE REPORT\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        if pcap_file.exists() and pcap_file.stat().st_size > 0 and not _capture_interrupted.is_set():
+            packet_count = _count_packets(tshark_path, pcap_file)
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            _write_header(f, "NETWORK TRAFFIC CAPTURE REPORT")
+            f.write(f"Capture Time: {_capture_time()}\n")
             f.write(f"Duration: {duration} seconds\n")
 
             if result.returncode == 0 and pcap_file.exists() and pcap_file.stat().st_size > 0:
@@ -474,12 +679,43 @@ def _find_latest_memory_dump():
     dump_dir = ARTIFACTS_DIR / "memory"
     if not dump_dir.exists():
         return None
-    dumps = sorted(
-        dump_dir.glob("memory_dump_*.raw"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True
-    )
-    return dumps[0] if dumps else None
+    return max(dump_dir.glob("memory_dump_*.raw"), key=lambda p: p.name, default=None)
+
+VOLATILITY_PLUGINS = ["windows.info", "windows.pslist", "windows.netscan"]
+VOLATILITY_PLUGIN_TIMEOUT = 180
+
+_VOLATILITY_BATCH_SCRIPT = """
+import contextlib, io, json, sys
+from volatility3 import cli
+
+dump_path, plugins = sys.argv[1], sys.argv[2:]
+for plugin in plugins:
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    sys.argv = ["vol", "-f", dump_path, plugin]
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            cli.main()
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception as e:
+            code = 1
+            err.write(f"{e}\\n")
+    print(json.dumps({"plugin": plugin, "returncode": code, "stdout": out.getvalue(), "stderr": err.getvalue()}), flush=True)
+"""
+
+def _parse_volatility_results(output):
+    if isinstance(output, bytes):
+        output = output.decode('utf-8', errors='replace')
+    results = {}
+    for line in (output or '').splitlines():
+        try:
+            plugin_result = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(plugin_result, dict) and plugin_result.get('plugin') in VOLATILITY_PLUGINS:
+            results[plugin_result['plugin']] = plugin_result
+    return results
 
 def run_volatility_analysis(memory_dump_path=None):
     logger.info("Running Volatility3 analysis...")
@@ -490,10 +726,8 @@ def run_volatility_analysis(memory_dump_path=None):
     dump_path = Path(memory_dump_path) if memory_dump_path else _find_latest_memory_dump()
 
     with open(report_file, 'w', encoding='utf-8') as f:
-        f.write("="*80 + "\n")
-        f.write("VOLATILITY3 MEMORY ANALYSIS REPORT\n")
-        f.write("="*80 + "\n\n")
-        f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        _write_header(f, "VOLATILITY3 MEMORY ANALYSIS REPORT")
+        f.write(f"Capture Time: {_capture_time()}\n")
 
         if not dump_path or not dump_path.exists():
             f.write("\nStatus: Skipped (memory dump not found)\n")
@@ -501,46 +735,53 @@ def run_volatility_analysis(memory_dump_path=None):
             return report_file
 
         f.write(f"\nMemory Dump: {dump_path}\n")
-        f.write("Plugins: windows.info, windows.pslist, windows.netscan\n\n")
+        f.write(f"Plugins: {', '.join(VOLATILITY_PLUGINS)}\n\n")
 
-        base_cmd = [sys.executable, "-m", "volatility3", "-f", str(dump_path)]
-        plugins = [
-            ("windows.info", []),
-            ("windows.pslist", []),
-            ("windows.netscan", []),
-        ]
+        timeout = VOLATILITY_PLUGIN_TIMEOUT * len(VOLATILITY_PLUGINS)
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c", _VOLATILITY_BATCH_SCRIPT, str(dump_path), *VOLATILITY_PLUGINS],
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            output, failure = result.stdout, result.stderr.strip() or f"Volatility3 exited with code {result.returncode}"
+            failure_code = result.returncode or 1
+        except subprocess.TimeoutExpired as e:
+            output, failure, failure_code = e.stdout, f"Volatility3 timed out after {timeout}s", 1
+        except FileNotFoundError:
+            f.write("Error: Volatility3 module not found. Install with pip install volatility3\n")
+            return report_file
+
+        completed = _parse_volatility_results(output)
+        plugin_results = []
+        for plugin in VOLATILITY_PLUGINS:
+            if plugin in completed:
+                plugin_results.append(completed[plugin])
+            elif failure:
+                logger.warning(f"Volatility3 plugin {plugin} did not finish: {failure.splitlines()[-1]}")
+                plugin_results.append({'plugin': plugin, 'returncode': failure_code, 'stdout': '', 'stderr': failure})
+                failure = None
+            else:
+                plugin_results.append({'plugin': plugin, 'returncode': 1, 'stdout': '', 'stderr': "Not run (an earlier plugin did not finish)"})
 
-        for plugin, extra in plugins:
+        for plugin_result in plugin_results:
             f.write("-"*80 + "\n")
-            f.write(f"{plugin.upper()}\n")
+            f.write(f"{plugin_result['plugin'].upper()}\n")
             f.write("-"*80 + "\n")
-            try:
-                result = subprocess.run(
-                    base_cmd + [plugin] + extra,
-                    capture_output=True,
-                    text=True,
-                    timeout=180
-                )
-                if result.returncode == 0:
-                    output = result.stdout or "(no output)"
-                    f.write(output)
-                else:
-                    f.write(f"Error (code {result.returncode}): {result.stderr}\n")
-            except subprocess.TimeoutExpired:
-                f.write("Error: Volatility3 timed out\n")
-            except FileNotFoundError:
-                f.write("Error: Volatility3 module not found. Install with pip install volatility3\n")
-                break
-            except Exception as e:
-                f.write(f"Error running {plugin}: {e}\n")
+            if plugin_result['returncode'] == 0:
+                f.write(plugin_result['stdout'] or "(no output)")
+            else:
+                f.write(f"Error (code {plugin_result['returncode']}): {plugin_result['stderr']}\n")
             f.write("\n")
 
     logger.info(f"Volatility3 analysis complete: {report_file}")
     return report_file
 
+@functools.lru_cache(maxsize=None)
 def _find_ghidra_analyze_headless():
     ghidra_root = TOOLS_DIR / "ghidra"
-    if not ghidra_root.exists():
+    if not _tool_exists(ghidra_root):
         return None
     candidates = list(ghidra_root.glob("**/analyzeHeadless.bat"))
     return candidates[0] if candidates else None
@@ -565,10 +806,8 @@ def run_ghidra_analysis(target_file=None):
     target = Path(target_file) if target_file else _select_default_ghidra_target()
 
     with open(report_file, 'w', encoding='utf-8') as f:
-        f.write("="*80 + "\n")
-        f.write("GHIDRA STATIC ANALYSIS REPORT\n")
-        f.write("="*80 + "\n\n")
-        f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        _write_header(f, "GHIDRA STATIC ANALYSIS REPORT")
+        f.write(f"Capture Time: {_capture_time()}\n\n")
 
         if not analyzer or not analyzer.exists():
             f.write("Status: Skipped (Ghidra analyzeHeadless.bat not found)\n")
@@ -633,12 +872,10 @@ def capture_process_monitoring(duration=60):
     try:
 
         procmon_path = TOOLS_DIR / "sysinternals" / "procmon.exe"
-        if not procmon_path.exists():
+        if not _tool_exists(procmon_path):
             logger.warning("ProcMon not found, skipping process monitoring")
-            with open(report_file, 'w') as f:
-                f.write("="*80 + "\n")
-                f.write("PROCESS MONITORING REPORT (PROCMON)\n")
-                f.write("="*80 + "\n\n")
+            with open(report_file, 'w', encoding='utf-8') as f:
+                _write_header(f, "PROCESS MONITORING REPORT (PROCMON)")
                 f.write("Status: Skipped (ProcMon not installed)\n")
                 f.write("Please ensure Sysinternals Suite is installed\n")
             return report_file
@@ -653,18 +890,27 @@ def capture_process_monitoring(duration=60):
             '/Minimized'
         ]
 
-        procmon_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        procmon_process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + duration
 
-        time.sleep(duration)
+        try:
+            returncode = procmon_process.wait(timeout=duration)
+            if returncode != 0:
+                logger.warning(f"ProcMon exited early with code {returncode}")
+            else:
+                _capture_interrupted.wait(max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            pass
 
         try:
-            subprocess.run(
-                [str(procmon_path), "/Terminate"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                shell=False
-            )
+            if not _capture_interrupted.is_set():
+                subprocess.run(
+                    [str(procmon_path), "/Terminate"],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                    shell=False
+                )
         except Exception:
             pass
         finally:
@@ -677,10 +923,8 @@ def capture_process_monitoring(duration=60):
                     pass
 
         with open(report_file, 'w', encoding='utf-8', errors='ignore') as f:
-            f.write("="*80 + "\n")
-            f.write("PROCESS MONITORING REPORT (PROCMON)\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            _write_header(f, "PROCESS MONITORING REPORT (PROCMON)")
+            f.write(f"Capture Time: {_capture_time()}\n")
             f.write(f"Duration: {duration} seconds\n")
             f.write(f"ProcMon Path: {procmon_path}\n")
             f.write(f"Backing File: {procmon_file}\n\n")
@@ -702,6 +946,8 @@ def capture_process_monitoring(duration=60):
         logger.error(f"Error in process monitoring: {e}")
         return None
 
+TCPVIEW_STATES = (psutil.CONN_ESTABLISHED, psutil.CONN_LISTEN)
+
 def capture_network_connections_tcpview():
     logger.info("Capturing network connections with TCPView...")
 
@@ -711,40 +957,117 @@ def capture_network_connections_tcpview():
     try:
 
         tcpview_path = TOOLS_DIR / "sysinternals" / "tcpview.exe"
-        if not tcpview_path.exists():
+        if not _tool_exists(tcpview_path):
             logger.warning("TCPView not found, skipping network connection monitoring")
-            with open(report_file, 'w') as f:
-                f.write("="*80 + "\n")
-                f.write("NETWORK CONNECTIONS REPORT (TCPVIEW)\n")
-                f.write("="*80 + "\n\n")
+            with open(report_file, 'w', encoding='utf-8') as f:
+                _write_header(f, "NETWORK CONNECTIONS REPORT (TCPVIEW)")
                 f.write("Status: Skipped (TCPView not installed)\n")
                 f.write("Please ensure Sysinternals Suite is installed\n")
             return report_file
 
         logger.info("Capturing network connections...")
 
-        cmd = ['netstat', '-ano']
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        rows = [
+            f"{SOCKET_TYPE_NAMES.get(conn.type, '?'):<8} "
+            f"{f'{conn.laddr.ip}:{conn.laddr.port}' if conn.laddr else 'N/A':<30} "
+            f"{f'{conn.raddr.ip}:{conn.raddr.port}' if conn.raddr else 'N/A':<30} "
+            f"{conn.status:<15} {conn.pid or '-'}"
+            for conn in psutil.net_connections(kind='inet')
+            if conn.status in TCPVIEW_STATES
+        ]
 
-        with open(report_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("NETWORK CONNECTIONS REPORT (TCPVIEW)\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Capture Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("Note: For GUI view, open TCPView manually:\n")
-            f.write(f"  {tcpview_path}\n\n")
-            f.write("="*80 + "\n")
-            f.write("NETSTAT OUTPUT\n")
-            f.write("="*80 + "\n\n")
+        buf = io.StringIO()
+        _write_header(buf, "NETWORK CONNECTIONS REPORT (TCPVIEW)")
+        buf.write(f"Capture Time: {_capture_time()}\n\n")
+        buf.write("Note: For GUI view, open TCPView manually:\n")
+        buf.write(f"  {tcpview_path}\n\n")
+        _write_header(buf, "ESTABLISHED AND LISTENING CONNECTIONS")
+        buf.write(f"{'Proto':<8} {'Local Address':<30} {'Remote Address':<30} {'State':<15} PID\n")
+        buf.write("\n".join(rows))
+        buf.write("\n")
 
-            if result.returncode == 0:
-                f.write(result.stdout)
-            else:
-                f.write(f"Error: {result.stderr}\n")
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(buf.getvalue())
 
-        logger.info("Network connections captured with TCPView/netstat")
+        logger.info(f"Network connections captured for TCPView: {len(rows)} established/listening")
         return report_file
 
     except Exception as e:
         logger.error(f"Error capturing network connections: {e}")
         return None
+
+_capture_interrupted = threading.Event()
+
+def _ensure_dirs():
+    for subdir in ARTIFACT_SUBDIRS:
+        (ARTIFACTS_DIR / subdir).mkdir(parents=True, exist_ok=True)
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+
+def _run_capture(func, kwargs, on_complete=None):
+    if _capture_interrupted.is_set():
+        logger.warning(f"Skipping {func.__name__}: capture interrupted")
+        return None
+    try:
+        report = func(**kwargs)
+    except Exception as e:
+        logger.error(f"Error in {func.__name__}: {e}")
+        report = None
+    if on_complete:
+        on_complete(func.__name__, report)
+    return report
+
+def _capture_memory(on_complete=None):
+    dump_report = _run_capture(create_memory_dump, {}, on_complete)
+    volatility_report = _run_capture(run_volatility_analysis, {}, on_complete)
+    return [dump_report, volatility_report]
+
+def _terminate_child_processes():
+    children = psutil.Process().children(recursive=True)
+    for child in children:
+        try:
+            child.kill()
+        except psutil.NoSuchProcess:
+            pass
+    psutil.wait_procs(children, timeout=5)
+    if children:
+        logger.warning(f"Terminated {len(children)} capture process(es)")
+
+def run_all_captures(ghidra_target=None, traffic_duration=60, procmon_duration=60, include_memory=True, run_timestamp=None, on_complete=None):
+    global _run_timestamp, _run_capture_time
+    started = datetime.strptime(run_timestamp, "%Y%m%d_%H%M%S") if run_timestamp else datetime.now()
+    _run_timestamp = started.strftime("%Y%m%d_%H%M%S")
+    _run_capture_time = started.strftime('%Y-%m-%d %H:%M:%S')
+    _capture_interrupted.clear()
+    _ensure_dirs()
+
+    captures = [
+        (capture_running_processes, {}),
+        (capture_network_connections, {}),
+        (capture_network_traffic, {'duration': traffic_duration}),
+        (capture_network_connections_tcpview, {}),
+        (capture_process_monitoring, {'duration': procmon_duration}),
+        (capture_system_logs, {}),
+        (capture_registry_artifacts, {}),
+        (capture_browser_history, {}),
+        (run_ghidra_analysis, {'target_file': ghidra_target}),
+    ]
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(captures) + 1) as executor:
+            try:
+                memory_future = executor.submit(_capture_memory, on_complete) if include_memory else None
+                reports = list(executor.map(lambda capture: _run_capture(*capture, on_complete), captures))
+                if memory_future:
+                    reports.extend(memory_future.result())
+            except KeyboardInterrupt:
+                _capture_interrupted.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                _terminate_child_processes()
+                raise
+    finally:
+        _run_timestamp = None
+        _run_capture_time = None
+
+    artifact_writer.flush()
+
+    return [report for report in reports if report]
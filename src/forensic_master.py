@@ -1,11 +1,16 @@
 import os
 import sys
 import subprocess
+import io
+import json
+import shutil
 import logging
-import psutil
 import ctypes
 import argparse
+import importlib.util
+import sysconfig
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
 import time
 
@@ -15,13 +20,6 @@ if hasattr(sys.stdout, "reconfigure"):
     sys.stdout.reconfigure(encoding="utf-8")
     sys.stderr.reconfigure(encoding="utf-8")
 
-try:
-    from yara_scanner import run_yara_analysis
-    YARA_ENABLED = True
-except ImportError:
-    YARA_ENABLED = False
-    print("[WARNING] YARA scanner not available")
-
 from paths import (
     project_root,
     ARTIFACTS_DIR,
@@ -43,12 +41,31 @@ CONFIG = {
     "logs_dir": LOGS_DIR,
     "individual_reports_dir": INDIVIDUAL_REPORTS_DIR,
     "master_report_dir": MASTER_REPORTS_DIR,
+    "run_ts": None,
 }
 
+TOOLS_STATE_FILE = CONFIG["tools_dir"] / "tools_state.json"
+FORENSIC_TOOLS = [
+    ("sysinternals", "Sysinternals Suite", CONFIG["tools_dir"] / "sysinternals"),
+    ("wireshark", "Wireshark/TShark", Path("C:/Program Files/Wireshark")),
+    ("winpmem", "WinPMEM", CONFIG["tools_dir"] / "winpmem"),
+    ("volatility", "Volatility3", Path(sysconfig.get_paths()["purelib"])),
+    ("ghidra", "Ghidra", CONFIG["tools_dir"] / "ghidra"),
+]
+
+REPORT_BUFFER_SIZE = 1024 * 1024
+USE_SENDFILE = sys.platform.startswith('linux')
+DISK_PROBE_WORKERS = 4
+DISK_PROBE_TIMEOUT = 5
+
+def run_timestamp():
+    if CONFIG["run_ts"] is None:
+        CONFIG["run_ts"] = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return CONFIG["run_ts"]
+
 def setup_logging():
     CONFIG["logs_dir"].mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = CONFIG["logs_dir"] / f"forensic_run_{timestamp}.log"
+    log_file = CONFIG["logs_dir"] / f"forensic_run_{run_timestamp()}.log"
 
     logging.basicConfig(
         level=logging.INFO,
@@ -72,6 +89,9 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+if not (sys.stdout and sys.stdout.isatty()):
+    Colors = type('Colors', (), {name: '' for name in vars(Colors) if not name.startswith('_')})
+
 def print_banner():
     banner = f"""
 {Colors.CYAN}{Colors.BOLD}
@@ -125,9 +145,9 @@ def create_directory_structure():
         CONFIG["artifacts_dir"] / "ghidra",
     ]
 
-    for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created: {directory}")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda directory: directory.mkdir(parents=True, exist_ok=True), directories))
+    logger.info("Created %d directories under %s", len(directories), CONFIG["base_dir"])
 
     print(f"{Colors.GREEN}✓ Directory structure created{Colors.RESET}")
 
@@ -151,17 +171,36 @@ def check_and_install_dependencies():
     ]
 
     for import_name, pip_name in required_packages:
-        try:
-            __import__(import_name)
-            logger.info(f"[OK] {import_name} already installed")
+        if importlib.util.find_spec(import_name) is not None:
+            logger.info("[OK] %s already installed", import_name)
             print(f"{Colors.GREEN}[OK] {import_name}{Colors.RESET}")
-        except ImportError:
-            logger.info(f"Installing {pip_name}...")
+        else:
+            logger.info("Installing %s...", pip_name)
             print(f"{Colors.YELLOW}Installing {pip_name}...{Colors.RESET}")
             subprocess.check_call([sys.executable, "-m", "pip", "install", pip_name, "-q"])
-            logger.info(f"[OK] {pip_name} installed")
+            logger.info("[OK] %s installed", pip_name)
             print(f"{Colors.GREEN}[OK] {pip_name} installed{Colors.RESET}")
 
+def load_tools_state():
+    try:
+        with open(TOOLS_STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_tools_state(tools_state):
+    try:
+        with open(TOOLS_STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(tools_state, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not save tool state: {e}")
+
+def tool_mtime(tool_dir):
+    try:
+        return tool_dir.stat().st_mtime
+    except OSError:
+        return None
+
 def install_forensic_tools():
     logger.info("Setting up forensic tools...")
     print(f"\n{Colors.CYAN}[PHASE 2] Setting Up Forensic Tools{Colors.RESET}")
@@ -175,80 +214,79 @@ def install_forensic_tools():
         verify_tool_installation
     )
 
+    install_funcs = {
+        "sysinternals": install_sysinternals,
+        "wireshark": install_wireshark,
+        "winpmem": install_winpmem,
+        "volatility": install_volatility,
+        "ghidra": install_ghidra,
+    }
+
+    tools_state = load_tools_state()
     tools_status = {}
 
-    print(f"\n{Colors.BLUE}Checking Sysinternals Suite...{Colors.RESET}")
-    if verify_tool_installation("sysinternals"):
-        print(f"{Colors.GREEN}✓ Sysinternals Suite already installed{Colors.RESET}")
-        logger.info("Sysinternals Suite already installed, skipping installation")
-        tools_status['sysinternals'] = True
-    else:
-        print(f"{Colors.YELLOW}⚠ Sysinternals Suite not found, installing...{Colors.RESET}")
-        tools_status['sysinternals'] = install_sysinternals()
-        if tools_status['sysinternals']:
-            print(f"{Colors.GREEN}✓ Sysinternals Suite installed successfully{Colors.RESET}")
+    for tool_name, label, tool_dir in FORENSIC_TOOLS:
+        print(f"\n{Colors.BLUE}Checking {label}...{Colors.RESET}")
+        cached = tools_state.get(tool_name, {})
+        mtime = tool_mtime(tool_dir)
+        if mtime is not None and cached.get("present") and cached.get("mtime") == mtime:
+            print(f"{Colors.GREEN}✓ {label} already installed{Colors.RESET}")
+            logger.info("%s unchanged since last run, skipping verification", label)
+            tools_status[tool_name] = True
+            continue
+
+        if verify_tool_installation(tool_name):
+            print(f"{Colors.GREEN}✓ {label} already installed{Colors.RESET}")
+            logger.info("%s already installed, skipping installation", label)
+            tools_status[tool_name] = True
         else:
-            print(f"{Colors.RED}✗ Sysinternals Suite installation failed{Colors.RESET}")
+            print(f"{Colors.YELLOW}⚠ {label} not found, installing...{Colors.RESET}")
+            tools_status[tool_name] = install_funcs[tool_name]()
+            if tools_status[tool_name]:
+                print(f"{Colors.GREEN}✓ {label} installed successfully{Colors.RESET}")
+            else:
+                print(f"{Colors.RED}✗ {label} installation failed{Colors.RESET}")
 
-    print(f"\n{Colors.BLUE}Checking Wireshark/TShark...{Colors.RESET}")
-    if verify_tool_installation("wireshark"):
-        print(f"{Colors.GREEN}✓ Wireshark/TShark already installed{Colors.RESET}")
-        logger.info("Wireshark/TShark already installed, skipping installation")
-        tools_status['wireshark'] = True
-    else:
-        print(f"{Colors.YELLOW}⚠ Wireshark/TShark not found, installing...{Colors.RESET}")
-        tools_status['wireshark'] = install_wireshark()
-        if tools_status['wireshark']:
-            print(f"{Colors.GREEN}✓ Wireshark/TShark installed successfully{Colors.RESET}")
-        else:
-            print(f"{Colors.RED}✗ Wireshark/TShark installation failed{Colors.RESET}")
+        tools_state[tool_name] = {"present": tools_status[tool_name], "mtime": tool_mtime(tool_dir)}
 
-    print(f"\n{Colors.BLUE}Checking WinPMEM...{Colors.RESET}")
-    if verify_tool_installation("winpmem"):
-        print(f"{Colors.GREEN}✓ WinPMEM already installed{Colors.RESET}")
-        logger.info("WinPMEM already installed, skipping installation")
-        tools_status['winpmem'] = True
-    else:
-        print(f"{Colors.YELLOW}⚠ WinPMEM not found, installing...{Colors.RESET}")
-        tools_status['winpmem'] = install_winpmem()
-        if tools_status['winpmem']:
-            print(f"{Colors.GREEN}✓ WinPMEM installed successfully{Colors.RESET}")
-        else:
-            print(f"{Colors.RED}✗ WinPMEM installation failed{Colors.RESET}")
+    save_tools_state(tools_state)
 
-    print(f"\n{Colors.BLUE}Checking Volatility3...{Colors.RESET}")
-    if verify_tool_installation("volatility"):
-        print(f"{Colors.GREEN}✓ Volatility3 already installed{Colors.RESET}")
-        logger.info("Volatility3 already installed, skipping installation")
-        tools_status['volatility'] = True
-    else:
-        print(f"{Colors.YELLOW}⚠ Volatility3 not found, installing...{Colors.RESET}")
-        tools_status['volatility'] = install_volatility()
-        if tools_status['volatility']:
-            print(f"{Colors.GREEN}✓ Volatility3 installed successfully{Colors.RESET}")
-        else:
-            print(f"{Colors.RED}✗ Volatility3 installation failed{Colors.RESET}")
+    return tools_status
 
-    print(f"\n{Colors.BLUE}Checking Ghidra...{Colors.RESET}")
-    if verify_tool_installation("ghidra"):
-        print(f"{Colors.GREEN}✓ Ghidra already installed{Colors.RESET}")
-        logger.info("Ghidra already installed, skipping installation")
-        tools_status['ghidra'] = True
-    else:
-        print(f"{Colors.YELLOW}⚠ Ghidra not found, installing...{Colors.RESET}")
-        tools_status['ghidra'] = install_ghidra()
-        if tools_status['ghidra']:
-            print(f"{Colors.GREEN}✓ Ghidra installed successfully{Colors.RESET}")
-        else:
-            print(f"{Colors.RED}✗ Ghidra installation failed{Colors.RESET}")
+def probe_disk(partition):
+    import psutil
+    usage = psutil.disk_usage(partition.mountpoint)
+    return {
+        "device": partition.device,
+        "mountpoint": partition.mountpoint,
+        "fstype": partition.fstype,
+        "total_gb": round(usage.total / (1024**3), 2),
+        "used_gb": round(usage.used / (1024**3), 2),
+        "free_gb": round(usage.free / (1024**3), 2),
+    }
 
-    return tools_status
+def collect_disk_info():
+    import psutil
+    partitions = [
+        partition for partition in psutil.disk_partitions(all=False)
+        if partition.fstype and 'cdrom' not in partition.opts
+    ]
+    executor = ThreadPoolExecutor(max_workers=DISK_PROBE_WORKERS)
+    probes = [(partition, executor.submit(probe_disk, partition)) for partition in partitions]
+    disk_info = []
+    for partition, probe in probes:
+        try:
+            disk_info.append(probe.result(timeout=DISK_PROBE_TIMEOUT))
+        except (OSError, FutureTimeoutError) as e:
+            logger.debug("Skipping disk %s: %r", partition.mountpoint, e)
+    executor.shutdown(wait=False)
+    return disk_info
 
 def capture_system_info():
+    import psutil
     logger.info("Capturing system information...")
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_file = CONFIG["individual_reports_dir"] / f"system_info_{timestamp}.txt"
+    report_file = CONFIG["individual_reports_dir"] / f"system_info_{run_timestamp()}.txt"
 
     system_info = {
         "timestamp": datetime.now().isoformat(),
@@ -258,119 +296,83 @@ def capture_system_info():
         "python_version": sys.version,
         "cpu_count": psutil.cpu_count(),
         "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-        "disk_info": []
+        "disk_info": collect_disk_info()
     }
 
-    for partition in psutil.disk_partitions():
-        try:
-            usage = psutil.disk_usage(partition.mountpoint)
-            system_info["disk_info"].append({
-                "device": partition.device,
-                "mountpoint": partition.mountpoint,
-                "fstype": partition.fstype,
-                "total_gb": round(usage.total / (1024**3), 2),
-                "used_gb": round(usage.used / (1024**3), 2),
-                "free_gb": round(usage.free / (1024**3), 2),
-            })
-        except:
-            pass
-
-    with open(report_file, 'w') as f:
-        f.write("="*70 + "\n")
-        f.write("SYSTEM INFORMATION REPORT\n")
-        f.write("="*70 + "\n\n")
-
-        for key, value in system_info.items():
-            if key != "disk_info":
-                f.write(f"{key.replace('_', ' ').title()}: {value}\n")
-
-        f.write("\nDisk Information:\n")
-        f.write("-"*70 + "\n")
-        for disk in system_info["disk_info"]:
-            f.write(f"\nDrive: {disk['device']}\n")
-            f.write(f"  Mount Point: {disk['mountpoint']}\n")
-            f.write(f"  File System: {disk['fstype']}\n")
-            f.write(f"  Total: {disk['total_gb']} GB\n")
-            f.write(f"  Used: {disk['used_gb']} GB\n")
-            f.write(f"  Free: {disk['free_gb']} GB\n")
+    buf = io.StringIO()
+    buf.write("="*70 + "\n")
+    buf.write("SYSTEM INFORMATION REPORT\n")
+    buf.write("="*70 + "\n\n")
 
-    logger.info(f"System info saved to {report_file}")
-    return report_file
-
-def run_forensic_analysis(ghidra_target=None):
-    logger.info("Starting forensic analysis...")
-    print(f"\n{Colors.CYAN}[PHASE 3] Running Forensic Analysis{Colors.RESET}")
-
-    individual_reports = []
-
-    from capture_artifacts import (
-        capture_running_processes,
-        capture_network_connections,
-        capture_system_logs,
-        capture_registry_artifacts,
-        capture_browser_history,
-        create_memory_dump,
-        capture_network_traffic,
-        capture_process_monitoring,
-        capture_network_connections_tcpview,
-        run_volatility_analysis,
-        run_ghidra_analysis
-    )
+    for key, value in system_info.items():
+        if key != "disk_info":
+            buf.write(f"{key.replace('_', ' ').title()}: {value}\n")
 
-    print(f"\n{Colors.BLUE}→ Capturing System Information...{Colors.RESET}")
-    report = capture_system_info()
-    individual_reports.append(report)
-    print(f"{Colors.GREEN}✓ System information captured{Colors.RESET}")
+    buf.write("\nDisk Information:\n")
+    buf.write("-"*70 + "\n")
+    for disk in system_info["disk_info"]:
+        buf.write(f"\nDrive: {disk['device']}\n")
+        buf.write(f"  Mount Point: {disk['mountpoint']}\n")
+        buf.write(f"  File System: {disk['fstype']}\n")
+        buf.write(f"  Total: {disk['total_gb']} GB\n")
+        buf.write(f"  Used: {disk['used_gb']} GB\n")
+        buf.write(f"  Free: {disk['free_gb']} GB\n")
 
-    print(f"\n{Colors.BLUE}→ Capturing Running Processes...{Colors.RESET}")
-    report = capture_running_processes()
-    individual_reports.append(report)
-    print(f"{Colors.GREEN}✓ Process list captured{Colors.RESET}")
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(buf.getvalue())
 
-    print(f"\n{Colors.BLUE}→ Capturing Network Connections...{Colors.RESET}")
-    report = capture_network_connections()
-    individual_reports.append(report)
-    print(f"{Colors.GREEN}✓ Network connections captured{Colors.RESET}")
+    logger.info(f"System info saved to {report_file}")
+    return report_file
 
-    print(f"\n{Colors.BLUE}→ Capturing Network Traffic (TShark)...{Colors.RESET}")
-    report = capture_network_traffic(duration=60)
-    if report:
-        individual_reports.append(report)
-        print(f"{Colors.GREEN}✓ Network traffic captured{Colors.RESET}")
-    else:
-        print(f"{Colors.YELLOW}⚠ Network traffic capture skipped or failed{Colors.RESET}")
+CAPTURE_LABELS = {
+    "capture_system_info": "System information",
+    "capture_running_processes": "Process list",
+    "capture_network_connections": "Network connections",
+    "capture_network_traffic": "Network traffic (TShark)",
+    "capture_network_connections_tcpview": "TCPView network connections",
+    "capture_process_monitoring": "Process monitoring (ProcMon)",
+    "capture_system_logs": "System logs",
+    "capture_registry_artifacts": "Registry artifacts",
+    "capture_browser_history": "Browser history",
+    "run_ghidra_analysis": "Ghidra analysis",
+    "create_memory_dump": "Memory dump",
+    "run_volatility_analysis": "Volatility3 analysis",
+}
 
-    print(f"\n{Colors.BLUE}→ Capturing Network Connections (TCPView)...{Colors.RESET}")
-    report = capture_network_connections_tcpview()
+def report_capture_complete(name, report):
+    label = CAPTURE_LABELS.get(name, name)
     if report:
-        individual_reports.append(report)
-        print(f"{Colors.GREEN}✓ TCPView network connections captured{Colors.RESET}")
+        logger.info(f"{label} captured: {report}")
+        print(f"{Colors.GREEN}✓ {label} captured{Colors.RESET}")
     else:
-        print(f"{Colors.YELLOW}⚠ TCPView capture skipped or failed{Colors.RESET}")
+        logger.warning(f"{label} skipped or failed")
+        print(f"{Colors.YELLOW}⚠ {label} skipped or failed{Colors.RESET}")
 
-    print(f"\n{Colors.BLUE}→ Starting Process Monitoring (ProcMon)...{Colors.RESET}")
-    print(f"{Colors.YELLOW}  Monitoring for 60 seconds...{Colors.RESET}")
-    report = capture_process_monitoring(duration=60)
-    if report:
-        individual_reports.append(report)
-        print(f"{Colors.GREEN}✓ Process monitoring completed{Colors.RESET}")
-    else:
-        print(f"{Colors.YELLOW}⚠ Process monitoring skipped or failed{Colors.RESET}")
+def run_forensic_analysis(ghidra_target=None):
+    logger.info("Starting forensic analysis...")
+    print(f"\n{Colors.CYAN}[PHASE 3] Running Forensic Analysis{Colors.RESET}")
 
-    print(f"\n{Colors.BLUE}→ Capturing System Logs...{Colors.RESET}")
-    report = capture_system_logs()
-    individual_reports.append(report)
-    print(f"{Colors.GREEN}✓ System logs captured{Colors.RESET}")
+    from capture_artifacts import run_all_captures
 
-    print(f"\n{Colors.BLUE}→ Capturing Registry Artifacts...{Colors.RESET}")
-    report = capture_registry_artifacts()
-    individual_reports.append(report)
-    print(f"{Colors.GREEN}✓ Registry artifacts captured{Colors.RESET}")
+    print(f"\n{Colors.BLUE}→ Running all captures concurrently (TShark and ProcMon run for 60 seconds)...{Colors.RESET}")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        system_info_future = executor.submit(capture_system_info)
+        system_info_future.add_done_callback(
+            lambda future: report_capture_complete("capture_system_info", future.result())
+        )
+        capture_reports = run_all_captures(
+            ghidra_target=ghidra_target,
+            run_timestamp=run_timestamp(),
+            on_complete=report_capture_complete,
+        )
+        individual_reports = [system_info_future.result(), *capture_reports]
 
-    print(f"\n{Colors.BLUE}→ Capturing Browser History...{Colors.RESET}")
-    report = capture_browser_history()
-    individual_reports.append(report)
-    print(f"{Colors.GREEN}✓ Browser history captured{Colors.RESET}")
+    try:
+        from yara_scanner import run_yara_analysis
+        YARA_ENABLED = True
+    except ImportError:
+        YARA_ENABLED = False
+        logger.warning("YARA scanner not available")
 
     if YARA_ENABLED:
         print(f"\n{Colors.BLUE}→ Running YARA Malware Analysis...{Colors.RESET}")
@@ -388,80 +390,101 @@ def run_forensic_analysis(ghidra_target=None):
         print(f"\n{Colors.YELLOW}⚠ YARA not installed - Malware scan skipped{Colors.RESET}")
         print(f"{Colors.YELLOW}  Install with: pip install yara-python{Colors.RESET}")
 
-    print(f"\n{Colors.YELLOW}→ Creating Memory Dump (this may take a few minutes)...{Colors.RESET}")
-    report = create_memory_dump()
-    if report:
-        individual_reports.append(report)
-        print(f"{Colors.GREEN}✓ Memory dump created{Colors.RESET}")
-    else:
-        print(f"{Colors.YELLOW}⚠ Memory dump skipped or failed{Colors.RESET}")
-
-    print(f"\n{Colors.BLUE}→ Running Volatility3 Memory Analysis...{Colors.RESET}")
-    report = run_volatility_analysis()
-    if report:
-        individual_reports.append(report)
-        print(f"{Colors.GREEN}✓ Volatility3 analysis completed{Colors.RESET}")
-    else:
-        print(f"{Colors.YELLOW}⚠ Volatility3 analysis skipped or failed{Colors.RESET}")
-
-    print(f"\n{Colors.BLUE}→ Running Ghidra Static Analysis...{Colors.RESET}")
-    report = run_ghidra_analysis(target_file=ghidra_target)
-    if report:
-        individual_reports.append(report)
-        print(f"{Colors.GREEN}✓ Ghidra analysis completed{Colors.RESET}")
-    else:
-        print(f"{Colors.YELLOW}⚠ Ghidra analysis skipped or failed{Colors.RESET}")
-
     return individual_reports
 
-def compile_master_report(individual_reports):
+def append_report(master, report_path):
+    with open(report_path, 'rb') as report:
+        if not USE_SENDFILE:
+            shutil.copyfileobj(report, master, REPORT_BUFFER_SIZE)
+            return
+        master.flush()
+        remaining = os.fstat(report.fileno()).st_size
+        offset = 0
+        while remaining > 0:
+            sent = os.sendfile(master.fileno(), report.fileno(), offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
+def report_sections(individual_reports):
+    sections = []
+    for report_path in individual_reports:
+        report_path = Path(report_path)
+        try:
+            size = report_path.stat().st_size
+        except OSError:
+            size = None
+        sections.append({"name": report_path.stem, "path": str(report_path), "size": size})
+    return sections
+
+def compile_master_report(individual_reports, execution_time, bundle=False):
     logger.info("Compiling master report...")
     print(f"\n{Colors.CYAN}[PHASE 4] Compiling Master Report{Colors.RESET}")
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    master_report_file = CONFIG["master_report_dir"] / f"MASTER_FORENSIC_REPORT_{timestamp}.txt"
-
-    with open(master_report_file, 'w', encoding='utf-8') as master:
-
-        master.write("╔" + "="*78 + "╗\n")
-        master.write("║" + " "*78 + "║\n")
-        master.write("║" + "  MASTER FORENSIC ANALYSIS REPORT".center(78) + "║\n")
-        master.write("║" + " "*78 + "║\n")
-        master.write("╚" + "="*78 + "╝\n\n")
-
-        master.write(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        master.write(f"Analysis Duration: {time.time()}\n")
-        master.write(f"Total Individual Reports: {len(individual_reports)}\n\n")
-
-        master.write("="*80 + "\n")
-        master.write("TABLE OF CONTENTS\n")
-        master.write("="*80 + "\n\n")
-
-        for idx, report_path in enumerate(individual_reports, 1):
-            master.write(f"{idx}. {Path(report_path).stem}\n")
-
-        master.write("\n" + "="*80 + "\n")
-        master.write("DETAILED FINDINGS\n")
-        master.write("="*80 + "\n\n")
+    master_report_file = CONFIG["master_report_dir"] / f"MASTER_FORENSIC_REPORT_{run_timestamp()}.txt"
+    master_index_file = master_report_file.with_suffix(".json")
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    sections = report_sections(individual_reports)
+
+    with open(master_index_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            "run_timestamp": run_timestamp(),
+            "generated": generated,
+            "analysis_duration_seconds": round(execution_time, 2),
+            "individual_reports_dir": str(CONFIG["individual_reports_dir"]),
+            "artifacts_dir": str(CONFIG["artifacts_dir"]),
+            "sections": sections,
+        }, f, indent=2)
+
+    with open(master_report_file, 'wb', buffering=REPORT_BUFFER_SIZE) as master:
+        write = lambda text: master.write(text.replace('\n', os.linesep).encode('utf-8'))
+
+        parts = [
+            "╔" + "="*78 + "╗\n",
+            "║" + " "*78 + "║\n",
+            "║" + "  MASTER FORENSIC ANALYSIS REPORT".center(78) + "║\n",
+            "║" + " "*78 + "║\n",
+            "╚" + "="*78 + "╝\n\n",
+            f"Report Generated: {generated}\n",
+            f"Analysis Duration: {execution_time:.2f}s\n",
+            f"Total Individual Reports: {len(individual_reports)}\n\n",
+            "="*80 + "\n",
+            "TABLE OF CONTENTS\n",
+            "="*80 + "\n\n",
+        ]
+        parts.extend(
+            f"{idx}. {section['name']}\n   {section['path']}\n"
+            for idx, section in enumerate(sections, 1)
+        )
+        if bundle:
+            parts += [
+                "\n" + "="*80 + "\n",
+                "DETAILED FINDINGS\n",
+                "="*80 + "\n\n",
+            ]
+        else:
+            parts.append("\nRe-run with --bundle to embed the individual reports in this file.\n")
+        write(''.join(parts))
 
-        for idx, report_path in enumerate(individual_reports, 1):
-            master.write("\n" + "─"*80 + "\n")
-            master.write(f"SECTION {idx}: {Path(report_path).stem.upper()}\n")
-            master.write("─"*80 + "\n\n")
+        for idx, report_path in enumerate(individual_reports if bundle else [], 1):
+            write(f"\n{'─'*80}\nSECTION {idx}: {Path(report_path).stem.upper()}\n{'─'*80}\n\n")
 
             try:
-                with open(report_path, 'r', encoding='utf-8', errors='ignore') as report:
-                    master.write(report.read())
-                master.write("\n\n")
+                append_report(master, report_path)
+                write("\n\n")
             except Exception as e:
-                master.write(f"Error reading report: {e}\n\n")
-
-        master.write("\n" + "="*80 + "\n")
-        master.write("END OF REPORT\n")
-        master.write("="*80 + "\n")
-        master.write(f"\nReport saved to: {master_report_file}\n")
-        master.write(f"Individual reports location: {CONFIG['individual_reports_dir']}\n")
-        master.write(f"Artifacts location: {CONFIG['artifacts_dir']}\n")
+                write(f"Error reading report: {e}\n\n")
+
+        write(''.join([
+            "\n" + "="*80 + "\n",
+            "END OF REPORT\n",
+            "="*80 + "\n",
+            f"\nReport saved to: {master_report_file}\n",
+            f"Report index: {master_index_file}\n",
+            f"Individual reports location: {CONFIG['individual_reports_dir']}\n",
+            f"Artifacts location: {CONFIG['artifacts_dir']}\n",
+        ]))
 
     logger.info(f"Master report saved to {master_report_file}")
     print(f"{Colors.GREEN}✓ Master report compiled{Colors.RESET}")
@@ -485,7 +508,7 @@ def generate_summary():
     print(f"  • Logs: {Colors.YELLOW}{CONFIG['logs_dir']}{Colors.RESET}")
 
 def main():
-    start_time = time.time()
+    start_perf = time.perf_counter()
 
     parser = argparse.ArgumentParser(add_help=True)
     parser.add_argument(
@@ -493,6 +516,11 @@ def main():
         default=os.environ.get("GHIDRA_TARGET"),
         help="Path to a binary to analyze with Ghidra (or set env var GHIDRA_TARGET).",
     )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Copy every individual report into the master report instead of only listing them.",
+    )
     args, _unknown = parser.parse_known_args()
 
     try:
@@ -510,9 +538,9 @@ def main():
 
         individual_reports = run_forensic_analysis(ghidra_target=args.ghidra_target)
 
-        master_report = compile_master_report(individual_reports)
+        master_report = compile_master_report(individual_reports, time.perf_counter() - start_perf, bundle=args.bundle)
 
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_perf
 
         generate_summary()
 
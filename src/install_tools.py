@@ -3,42 +3,70 @@ import os
 import sys
 import subprocess
 import urllib.request
+import urllib.error
 import zipfile
 import logging
 from pathlib import Path
 from datetime import datetime
 import ctypes
 import shutil
+import threading
+import argparse
+import functools
+import json
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from paths import TOOLS_DIR, LOGS_DIR, DOWNLOADS_DIR
 
+RANGED_DOWNLOAD_PARTS = 4
+RANGED_DOWNLOAD_MIN_SIZE = 32 * 1024 * 1024
+
 TOOLS_CONFIG = {
     "sysinternals": {
         "url": "https://download.sysinternals.com/files/SysinternalsSuite.zip",
         "type": "zip",
+        "download_path": DOWNLOADS_DIR / "SysinternalsSuite.zip",
         "destination": TOOLS_DIR / "sysinternals"
     },
     "wireshark": {
         "url": "https://2.na.dl.wireshark.org/win64/Wireshark-latest-x64.exe",
         "type": "installer",
+        "download_path": DOWNLOADS_DIR / "Wireshark-installer.exe",
+        "download_parts": RANGED_DOWNLOAD_PARTS,
         "silent_args": ["/S", "/quicklaunchicon=no", "/desktopicon=no"]
     },
     "winpmem": {
         "url": "https://github.com/Velocidex/WinPmem/releases/download/v4.0.rc1/winpmem_mini_x64_rc2.exe",
         "type": "portable",
+        "download_path": TOOLS_DIR / "winpmem" / "winpmem_mini_x64_rc2.exe",
         "destination": TOOLS_DIR / "winpmem"
     },
     "ghidra": {
         "url": "https://github.com/NationalSecurityAgency/ghidra/releases/download/Ghidra_10.4_build/ghidra_10.4_PUBLIC_20230928.zip",
         "type": "zip",
+        "download_path": DOWNLOADS_DIR / "ghidra.zip",
+        "download_parts": RANGED_DOWNLOAD_PARTS,
         "destination": TOOLS_DIR / "ghidra"
     },
     "volatility": {
         "type": "pip",
-        "package": "volatility3"
+        "packages": ["volatility3"]
     }
 }
 
+DOWNLOAD_WORKERS = 4
+INSTALL_WORKERS = 4
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = 30
+ZIP_COPY_BUFFER = 1024 * 1024
+EXTRACT_JOBS = min(8, os.cpu_count() or 1)
+ZIP_SKIPPED_PREFIXES = ('__MACOSX/', '.')
+USE_DOWNLOAD_CACHE = True
+PIP_ENV = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+
+_pending_downloads = {}
+
 def setup_logging():
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     log_file = LOGS_DIR / f"installation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
@@ -75,30 +103,199 @@ def create_directories():
         directory.mkdir(parents=True, exist_ok=True)
         logger.info(f"Created/verified directory: {directory}")
 
-def download_file(url, destination):
+def download_meta_path(destination):
+    return destination.with_name(destination.name + ".meta.json")
+
+def head_request(url):
     try:
-        logger.info(f"Downloading from: {url}")
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+            return response.headers
+    except Exception as e:
+        logger.debug(f"HEAD request failed for {url}: {e}")
+        return None
+
+def remote_metadata(url, headers):
+    if headers is None:
+        return None
+    meta = {
+        "url": url,
+        "etag": headers.get("ETag"),
+        "content_length": headers.get("Content-Length"),
+    }
+    if not meta["etag"] and not meta["content_length"]:
+        return None
+    return meta
 
-        def progress_hook(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = min(downloaded * 100 / total_size, 100)
-            sys.stdout.write(f"\rProgress: {percent:.1f}%")
-            sys.stdout.flush()
+def cached_download_valid(destination, meta):
+    try:
+        stored = json.loads(download_meta_path(destination).read_text())
+        size = destination.stat().st_size
+    except (OSError, ValueError):
+        return False
+    if stored != meta:
+        return False
+    return not meta["content_length"] or size == int(meta["content_length"])
+
+def progress_tracker(total, show_progress):
+    lock = threading.Lock()
+    state = {"downloaded": 0, "percent": -1}
+
+    def advance(count):
+        with lock:
+            state["downloaded"] += count
+            if show_progress and total:
+                percent = state["downloaded"] * 100 // total
+                if percent != state["percent"]:
+                    state["percent"] = percent
+                    sys.stdout.write(f"\rProgress: {percent}%")
+                    sys.stdout.flush()
+
+    return state, advance
+
+def fetch_stream(url, destination, show_progress):
+    with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response, open(destination, 'wb') as f:
+        headers = response.headers
+        total = int(headers.get("Content-Length") or 0)
+        state, advance = progress_tracker(total, show_progress)
+        while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            advance(len(chunk))
+    return headers, total, state["downloaded"]
+
+def fetch_range(url, destination, start, end, advance):
+    request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+    with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response, open(destination, 'r+b') as f:
+        if response.status != 206:
+            raise urllib.error.URLError(f"server ignored Range request (HTTP {response.status})")
+        f.seek(start)
+        while chunk := response.read(min(DOWNLOAD_CHUNK_SIZE, end + 1 - f.tell())):
+            f.write(chunk)
+            advance(len(chunk))
+
+def fetch_ranges(url, destination, total, parts, show_progress):
+    with open(destination, 'wb') as f:
+        f.truncate(total)
+    part_size = -(-total // parts)
+    ranges = [(start, min(start + part_size, total) - 1) for start in range(0, total, part_size)]
+    state, advance = progress_tracker(total, show_progress)
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(fetch_range, url, destination, start, end, advance) for start, end in ranges]
+        for future in futures:
+            future.result()
+    return state["downloaded"]
+
+def fetch_file(url, destination, show_progress=True, parts=1):
+    destination = Path(destination)
+    show_progress = show_progress and sys.stdout.isatty()
+    try:
+        head = head_request(url) if USE_DOWNLOAD_CACHE or parts > 1 else None
+        if USE_DOWNLOAD_CACHE:
+            meta = remote_metadata(url, head)
+            if meta and cached_download_valid(destination, meta):
+                logger.info(f"Download cache hit: {destination}")
+                return True
+
+        download_meta_path(destination).unlink(missing_ok=True)
+        logger.info(f"Downloading from: {url}")
 
-        urllib.request.urlretrieve(url, destination, progress_hook)
-        print()
-        logger.info(f"Downloaded successfully to: {destination}")
+        size = int(head.get("Content-Length") or 0) if head else 0
+        ranged = parts > 1 and size >= RANGED_DOWNLOAD_MIN_SIZE and head.get("Accept-Ranges") == "bytes"
+        if ranged:
+            logger.info(f"Downloading in {parts} parallel ranges")
+            headers, total = head, size
+            try:
+                downloaded = fetch_ranges(url, destination, size, parts, show_progress)
+            except urllib.error.URLError as e:
+                logger.warning(f"Ranged download failed ({e}), retrying as a single stream")
+                ranged = False
+        if not ranged:
+            headers, total, downloaded = fetch_stream(url, destination, show_progress)
+
+        if show_progress:
+            print()
+        if total and downloaded < total:
+            raise urllib.error.ContentTooShortError(
+                f"retrieval incomplete: got only {downloaded} out of {total} bytes", None
+            )
+        if headers.get("ETag") or total:
+            download_meta_path(destination).write_text(json.dumps({
+                "url": url,
+                "etag": headers.get("ETag"),
+                "content_length": str(downloaded),
+            }))
+        logger.info(f"Downloaded successfully to: {destination} ({downloaded / (1024 * 1024):.1f} MB)")
         return True
     except Exception as e:
         logger.error(f"Download failed: {e}")
         return False
 
+def download_file(url, destination, parts=1):
+    pending = _pending_downloads.pop(Path(destination), None)
+    if pending is not None:
+        return pending.result()
+    return fetch_file(url, destination, parts=parts)
+
+def prefetch_downloads(tool_names):
+    downloads = [TOOLS_CONFIG[name] for name in tool_names if "url" in TOOLS_CONFIG[name]]
+    if not downloads:
+        return
+    logger.info(f"Downloading {len(downloads)} tool package(s) in parallel")
+    executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+    for config in downloads:
+        config["download_path"].parent.mkdir(parents=True, exist_ok=True)
+        _pending_downloads[config["download_path"]] = executor.submit(
+            fetch_file, config["url"], config["download_path"], False, config.get("download_parts", 1)
+        )
+    executor.shutdown(wait=False)
+
+def zip_entry_target(destination, filename):
+    parts = filename.replace('\\', '/').split('/')
+    if filename.startswith(('/', '\\')) or '..' in parts or ':' in parts[0]:
+        return None
+    return destination.joinpath(*[part for part in parts if part])
+
 def extract_zip(zip_path, destination):
     try:
         logger.info(f"Extracting {zip_path} to {destination}")
+        destination = Path(destination)
+        entries = []
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(destination)
-        logger.info("Extraction completed")
+            for info in zip_ref.infolist():
+                if info.filename.startswith(ZIP_SKIPPED_PREFIXES):
+                    continue
+                target = zip_entry_target(destination, info.filename)
+                if target is None:
+                    logger.warning(f"Skipping unsafe zip entry: {info.filename}")
+                    continue
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                entries.append((info, target))
+
+        for parent in {target.parent for _info, target in entries}:
+            parent.mkdir(parents=True, exist_ok=True)
+        entries.sort(key=lambda entry: entry[0].file_size, reverse=True)
+
+        worker_state = threading.local()
+        archives = []
+
+        def extract_entry(entry):
+            info, target = entry
+            archive = getattr(worker_state, "archive", None)
+            if archive is None:
+                archive = worker_state.archive = zipfile.ZipFile(zip_path, 'r')
+                archives.append(archive)
+            with archive.open(info) as src, open(target, 'wb', buffering=ZIP_COPY_BUFFER) as dst:
+                shutil.copyfileobj(src, dst, ZIP_COPY_BUFFER)
+
+        try:
+            with ThreadPoolExecutor(max_workers=EXTRACT_JOBS) as executor:
+                list(executor.map(extract_entry, entries))
+        finally:
+            for archive in archives:
+                archive.close()
+        logger.info(f"Extraction completed ({len(entries)} files, {EXTRACT_JOBS} workers)")
         return True
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
@@ -127,17 +324,18 @@ def run_installer(installer_path, silent_args=None):
         logger.error(f"Installation error: {e}")
         return False
 
-def install_pip_package(package_name):
+def install_pip_packages(packages):
     try:
-        logger.info(f"Installing pip package: {package_name}")
+        logger.info(f"Installing pip packages: {' '.join(packages)}")
         result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", package_name],
+            [sys.executable, "-m", "pip", "install", "--no-input", "--disable-pip-version-check", *packages],
             capture_output=True,
-            text=True
+            text=True,
+            env=PIP_ENV
         )
 
         if result.returncode == 0:
-            logger.info(f"Package {package_name} installed successfully")
+            logger.info(f"Packages {' '.join(packages)} installed successfully")
             return True
         else:
             logger.error(f"pip installation failed: {result.stderr}")
@@ -146,6 +344,27 @@ def install_pip_package(package_name):
         logger.error(f"pip installation error: {e}")
         return False
 
+def install_pip_tools(tool_names):
+    pip_tools = [name for name in tool_names if TOOLS_CONFIG[name]["type"] == "pip"]
+    if not pip_tools:
+        return {}
+    packages = [package for name in pip_tools for package in TOOLS_CONFIG[name]["packages"]]
+    installed = install_pip_packages(packages)
+    verify_tool_installation.cache_clear()
+    if not installed:
+        logger.error(f"pip installation failed for: {', '.join(pip_tools)}")
+        return {name: False for name in pip_tools}
+    return {name: verify_tool_installation(name) for name in pip_tools}
+
+def pip_packages_installed(packages):
+    try:
+        for package in packages:
+            importlib.metadata.distribution(package)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
+
+@functools.lru_cache(maxsize=None)
 def verify_tool_installation(tool_name):
     def check_wireshark():
 
@@ -162,10 +381,7 @@ def verify_tool_installation(tool_name):
         "sysinternals": lambda: (TOOLS_DIR / "sysinternals" / "procmon.exe").exists(),
         "wireshark": check_wireshark,
         "winpmem": lambda: (TOOLS_DIR / "winpmem" / "winpmem_mini_x64_rc2.exe").exists(),
-        "volatility": lambda: subprocess.run(
-            [sys.executable, "-m", "pip", "show", "volatility3"],
-            capture_output=True
-        ).returncode == 0,
+        "volatility": lambda: pip_packages_installed(TOOLS_CONFIG["volatility"]["packages"]),
         "ghidra": lambda: (TOOLS_DIR / "ghidra").exists()
     }
 
@@ -176,40 +392,31 @@ def verify_tool_installation(tool_name):
     return False
 
 def install_sysinternals():
-
-    if verify_tool_installation("sysinternals"):
-        logger.info("Sysinternals Suite already installed, skipping installation")
-        return True
-
     logger.info("=" * 50)
     logger.info("Installing Sysinternals Suite")
     logger.info("=" * 50)
 
     config = TOOLS_CONFIG["sysinternals"]
-    download_path = DOWNLOADS_DIR / "SysinternalsSuite.zip"
+    download_path = config["download_path"]
 
-    if not download_file(config["url"], download_path):
+    if not download_file(config["url"], download_path, config.get("download_parts", 1)):
         return False
 
     if not extract_zip(download_path, config["destination"]):
         return False
 
+    verify_tool_installation.cache_clear()
     return verify_tool_installation("sysinternals")
 
 def install_wireshark():
-
-    if verify_tool_installation("wireshark"):
-        logger.info("Wireshark already installed, skipping installation")
-        return True
-
     logger.info("=" * 50)
     logger.info("Installing Wireshark")
     logger.info("=" * 50)
 
     config = TOOLS_CONFIG["wireshark"]
-    download_path = DOWNLOADS_DIR / "Wireshark-installer.exe"
+    download_path = config["download_path"]
 
-    if not download_file(config["url"], download_path):
+    if not download_file(config["url"], download_path, config.get("download_parts", 1)):
         logger.error("Failed to download Wireshark installer")
         return False
 
@@ -247,6 +454,7 @@ def install_wireshark():
     import time
     logger.info("Waiting for installation to complete and PATH to update...")
     time.sleep(5)
+    verify_tool_installation.cache_clear()
 
     logger.info("Verifying Wireshark installation...")
 
@@ -273,22 +481,18 @@ def install_wireshark():
     return True
 
 def install_winpmem():
-
-    if verify_tool_installation("winpmem"):
-        logger.info("WinPMEM already installed, skipping installation")
-        return True
-
     logger.info("=" * 50)
     logger.info("Installing WinPMEM")
     logger.info("=" * 50)
 
     config = TOOLS_CONFIG["winpmem"]
     config["destination"].mkdir(exist_ok=True)
-    download_path = config["destination"] / "winpmem_mini_x64_rc2.exe"
+    download_path = config["download_path"]
 
-    if not download_file(config["url"], download_path):
+    if not download_file(config["url"], download_path, config.get("download_parts", 1)):
         return False
 
+    verify_tool_installation.cache_clear()
     return verify_tool_installation("winpmem")
 
 def install_volatility():
@@ -298,9 +502,10 @@ def install_volatility():
 
     config = TOOLS_CONFIG["volatility"]
 
-    if not install_pip_package(config["package"]):
+    if not install_pip_packages(config["packages"]):
         return False
 
+    verify_tool_installation.cache_clear()
     return verify_tool_installation("volatility")
 
 def install_ghidra():
@@ -309,16 +514,17 @@ def install_ghidra():
     logger.info("=" * 50)
 
     config = TOOLS_CONFIG["ghidra"]
-    download_path = DOWNLOADS_DIR / "ghidra.zip"
+    download_path = config["download_path"]
 
     logger.info("Note: Ghidra requires Java Runtime Environment (JRE) 17+")
 
-    if not download_file(config["url"], download_path):
+    if not download_file(config["url"], download_path, config.get("download_parts", 1)):
         return False
 
     if not extract_zip(download_path, config["destination"]):
         return False
 
+    verify_tool_installation.cache_clear()
     return verify_tool_installation("ghidra")
 
 def generate_installation_report(results):
@@ -352,6 +558,24 @@ def generate_installation_report(results):
     return report_path
 
 def main():
+    global EXTRACT_JOBS, USE_DOWNLOAD_CACHE
+
+    parser = argparse.ArgumentParser(description="Install the forensic tools used by BitProbe")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=EXTRACT_JOBS,
+        help=f"Worker threads used to extract tool archives (default: {EXTRACT_JOBS}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Download tool packages again even if a matching copy is in the downloads folder.",
+    )
+    args = parser.parse_args()
+    EXTRACT_JOBS = max(1, args.jobs)
+    USE_DOWNLOAD_CACHE = not args.no_cache
+
     print("=" * 60)
     print("AUTOMATED FORENSIC TOOLS INSTALLATION")
     print("=" * 60)
@@ -363,8 +587,6 @@ def main():
 
     create_directories()
 
-    results = {}
-
     tools_to_install = [
         ("sysinternals", install_sysinternals),
         ("wireshark", install_wireshark),
@@ -373,18 +595,34 @@ def main():
         ("ghidra", install_ghidra)
     ]
 
-    for tool_name, install_func in tools_to_install:
-        try:
-
+    tool_names = [tool_name for tool_name, _install_func in tools_to_install]
+    with ThreadPoolExecutor(max_workers=len(tool_names)) as executor:
+        verified = dict(zip(tool_names, executor.map(verify_tool_installation, tool_names)))
+    missing_tools = [tool_name for tool_name in tool_names if not verified[tool_name]]
+    prefetch_downloads(missing_tools)
+    outcomes = install_pip_tools(missing_tools)
+
+    with ThreadPoolExecutor(max_workers=INSTALL_WORKERS) as executor:
+        futures = {}
+        for tool_name, install_func in tools_to_install:
+            if tool_name in outcomes:
+                continue
             if verify_tool_installation(tool_name):
                 print(f"✓ {tool_name.capitalize()} already installed, skipping...")
-                results[tool_name] = True
+                outcomes[tool_name] = True
             else:
-                results[tool_name] = install_func()
-        except Exception as e:
-            logger.error(f"Unexpected error installing {tool_name}: {e}")
-            results[tool_name] = False
-        print()
+                futures[executor.submit(install_func)] = tool_name
+
+        for future in as_completed(futures):
+            tool_name = futures[future]
+            try:
+                outcomes[tool_name] = future.result()
+            except Exception as e:
+                logger.error(f"Unexpected error installing {tool_name}: {e}")
+                outcomes[tool_name] = False
+    print()
+
+    results = {tool_name: outcomes[tool_name] for tool_name, _install_func in tools_to_install}
 
     report_path = generate_installation_report(results)
 
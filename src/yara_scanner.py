@@ -4,6 +4,8 @@ import sys
 import logging
 from pathlib import Path
 from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from paths import ARTIFACTS_DIR, INDIVIDUAL_REPORTS_DIR, RULES_DIR
 
@@ -17,6 +19,35 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 REPORTS_DIR = INDIVIDUAL_REPORTS_DIR
+SCAN_WORKERS = min(8, os.cpu_count() or 1)
+SEVERITY_SECTIONS = (
+    ('CRITICAL', '🔴 CRITICAL Threats'),
+    ('HIGH', '🟠 HIGH Severity Threats'),
+    ('MEDIUM', '🟡 MEDIUM Severity Threats'),
+    ('LOW', '🟢 LOW Severity Threats'),
+)
+
+REPORT_END = "\n" + "="*80 + "\n" + "END OF REPORT\n" + "="*80 + "\n"
+RECOMMENDATIONS_HEADER = "\n" + "="*80 + "\n" + "RECOMMENDATIONS\n" + "="*80 + "\n\n"
+CLEAN_REPORT_BODY = (
+    "✓ NO THREATS DETECTED\n"
+    "\nAll scanned artifacts appear clean.\n"
+    + RECOMMENDATIONS_HEADER
+    + "1. Continue regular security monitoring\n"
+    "2. Maintain up-to-date antivirus definitions\n"
+    "3. Perform periodic forensic analysis\n"
+    + REPORT_END
+)
+THREAT_REPORT_FOOTER = (
+    RECOMMENDATIONS_HEADER
+    + "1. Investigate all flagged artifacts immediately\n"
+    "2. Isolate affected systems from network\n"
+    "3. Perform deep malware analysis on suspicious files\n"
+    "4. Check for lateral movement indicators\n"
+    "5. Review all user accounts and privileges\n"
+    "6. Update antivirus and run full system scan\n"
+    + REPORT_END
+)
 
 def get_timestamp():
     return datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -42,8 +73,17 @@ class YARAScanner:
                 logger.error(f"YARA rules file not found: {self.rules_path}")
                 return False
 
+            compiled_path = self.rules_path.with_suffix('.compiled')
+            if self.load_compiled(compiled_path):
+                logger.info(f"✓ YARA rules loaded from cache: {compiled_path}")
+                return True
+
             logger.info(f"Loading YARA rules from: {self.rules_path}")
             self.rules = yara.compile(filepath=str(self.rules_path))
+            try:
+                self.rules.save(str(compiled_path))
+            except Exception as e:
+                logger.debug(f"Could not cache compiled YARA rules: {e}")
             logger.info("✓ YARA rules loaded successfully")
             return True
 
@@ -54,6 +94,15 @@ class YARAScanner:
             logger.error(f"Failed to load YARA rules: {e}")
             return False
 
+    def load_compiled(self, compiled_path):
+        try:
+            if compiled_path.stat().st_mtime < self.rules_path.stat().st_mtime:
+                return False
+            self.rules = yara.load(str(compiled_path))
+            return True
+        except Exception:
+            return False
+
     def scan_string(self, data_string):
         if not self.rules:
             return []
@@ -89,6 +138,20 @@ class YARAScanner:
             logger.error(f"Error scanning file {file_path}: {e}")
             return []
 
+def iter_txt_files(root):
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.normcase(entry.name).endswith('.txt') and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError as e:
+            logger.error(f"Cannot list {directory}: {e}")
+
 def scan_artifacts_directory(artifacts_dir):
     logger.info("Starting YARA scan of captured artifacts...")
 
@@ -109,22 +172,27 @@ def scan_artifacts_directory(artifacts_dir):
         logger.error(f"[ERROR] Artifacts directory not found: {artifacts_path}")
         return results
 
-    for artifact_file in artifacts_path.rglob("*.txt"):
+    artifact_files = list(iter_txt_files(str(artifacts_path)))
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        scanned = list(executor.map(scanner.scan_file, artifact_files))
+
+    for artifact_file, matches in zip(artifact_files, scanned):
         try:
             results['total_files_scanned'] += 1
-            matches = scanner.scan_file(artifact_file)
 
             if matches:
                 results['files_with_threats'] += 1
                 results['total_threats'] += len(matches)
 
+                relative_path = os.path.relpath(artifact_file, artifacts_path)
                 for match in matches:
+                    meta = getattr(match, 'meta', None) or {}
                     threat_info = {
-                        'file': str(artifact_file.relative_to(artifacts_path)),
+                        'file': relative_path,
                         'rule': match.rule,
-                        'severity': match.meta.get('severity', 'UNKNOWN') if hasattr(match, 'meta') else 'UNKNOWN',
-                        'category': match.meta.get('category', 'UNKNOWN') if hasattr(match, 'meta') else 'UNKNOWN',
-                        'description': match.meta.get('description', 'No description') if hasattr(match, 'meta') else 'No description'
+                        'severity': meta.get('severity', 'UNKNOWN'),
+                        'category': meta.get('category', 'UNKNOWN'),
+                        'description': meta.get('description', 'No description')
                     }
                     results['threats'].append(threat_info)
 
@@ -147,84 +215,44 @@ def generate_yara_report(scan_results):
     report_file = REPORTS_DIR / f"yara_scan_report_{timestamp}.txt"
 
     try:
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("YARA MALWARE DETECTION REPORT\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Files Scanned: {scan_results['total_files_scanned']}\n")
-            f.write(f"Files with Threats: {scan_results['files_with_threats']}\n")
-            f.write(f"Total Threats Detected: {scan_results['total_threats']}\n\n")
-
-            if scan_results['total_threats'] == 0:
-                f.write("✓ NO THREATS DETECTED\n")
-                f.write("\nAll scanned artifacts appear clean.\n")
-            else:
-                f.write("⚠️  THREATS DETECTED!\n\n")
-                f.write("="*80 + "\n")
-                f.write("THREAT DETAILS\n")
-                f.write("="*80 + "\n\n")
-
-                critical = [t for t in scan_results['threats'] if t['severity'] == 'CRITICAL']
-                high = [t for t in scan_results['threats'] if t['severity'] == 'HIGH']
-                medium = [t for t in scan_results['threats'] if t['severity'] == 'MEDIUM']
-                low = [t for t in scan_results['threats'] if t['severity'] == 'LOW']
-
-                if critical:
-                    f.write(f"\n🔴 CRITICAL Threats ({len(critical)}):\n")
-                    f.write("-"*80 + "\n")
-                    for threat in critical:
-                        f.write(f"\nRule: {threat['rule']}\n")
-                        f.write(f"File: {threat['file']}\n")
-                        f.write(f"Category: {threat['category']}\n")
-                        f.write(f"Description: {threat['description']}\n")
-
-                if high:
-                    f.write(f"\n🟠 HIGH Severity Threats ({len(high)}):\n")
-                    f.write("-"*80 + "\n")
-                    for threat in high:
-                        f.write(f"\nRule: {threat['rule']}\n")
-                        f.write(f"File: {threat['file']}\n")
-                        f.write(f"Category: {threat['category']}\n")
-                        f.write(f"Description: {threat['description']}\n")
-
-                if medium:
-                    f.write(f"\n🟡 MEDIUM Severity Threats ({len(medium)}):\n")
-                    f.write("-"*80 + "\n")
-                    for threat in medium:
-                        f.write(f"\nRule: {threat['rule']}\n")
-                        f.write(f"File: {threat['file']}\n")
-                        f.write(f"Category: {threat['category']}\n")
-                        f.write(f"Description: {threat['description']}\n")
-
-                if low:
-                    f.write(f"\n🟢 LOW Severity Threats ({len(low)}):\n")
-                    f.write("-"*80 + "\n")
-                    for threat in low:
-                        f.write(f"\nRule: {threat['rule']}\n")
-                        f.write(f"File: {threat['file']}\n")
-                        f.write(f"Category: {threat['category']}\n")
-                        f.write(f"Description: {threat['description']}\n")
-
-            f.write("\n" + "="*80 + "\n")
-            f.write("RECOMMENDATIONS\n")
-            f.write("="*80 + "\n\n")
-
-            if scan_results['total_threats'] > 0:
-                f.write("1. Investigate all flagged artifacts immediately\n")
-                f.write("2. Isolate affected systems from network\n")
-                f.write("3. Perform deep malware analysis on suspicious files\n")
-                f.write("4. Check for lateral movement indicators\n")
-                f.write("5. Review all user accounts and privileges\n")
-                f.write("6. Update antivirus and run full system scan\n")
-            else:
-                f.write("1. Continue regular security monitoring\n")
-                f.write("2. Maintain up-to-date antivirus definitions\n")
-                f.write("3. Perform periodic forensic analysis\n")
+        parts = [
+            "="*80 + "\n",
+            "YARA MALWARE DETECTION REPORT\n",
+            "="*80 + "\n\n",
+            f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Total Files Scanned: {scan_results['total_files_scanned']}\n",
+            f"Files with Threats: {scan_results['files_with_threats']}\n",
+            f"Total Threats Detected: {scan_results['total_threats']}\n\n",
+        ]
+
+        if scan_results['total_threats'] == 0:
+            parts.append(CLEAN_REPORT_BODY)
+        else:
+            parts.append("⚠️  THREATS DETECTED!\n\n")
+            parts.append("="*80 + "\n")
+            parts.append("THREAT DETAILS\n")
+            parts.append("="*80 + "\n\n")
+
+            grouped = defaultdict(list)
+            for threat in scan_results['threats']:
+                grouped[threat['severity']].append(threat)
+
+            for severity, title in SEVERITY_SECTIONS:
+                threats = grouped[severity]
+                if threats:
+                    parts.append(f"\n{title} ({len(threats)}):\n")
+                    parts.append("-"*80 + "\n")
+                    parts.extend(
+                        f"\nRule: {threat['rule']}\n"
+                        f"File: {threat['file']}\n"
+                        f"Category: {threat['category']}\n"
+                        f"Description: {threat['description']}\n"
+                        for threat in threats
+                    )
+            parts.append(THREAT_REPORT_FOOTER)
 
-            f.write("\n" + "="*80 + "\n")
-            f.write("END OF REPORT\n")
-            f.write("="*80 + "\n")
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
 
         logger.info(f"YARA report generated: {report_file}")
         return report_file
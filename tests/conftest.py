@@ -0,0 +1,55 @@
+import functools
+import json
+from pathlib import Path
+
+import pytest
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+TOOLS_CONFIG_PATH = BASE_DIR / 'config' / 'tools_config.json'
+
+@functools.lru_cache(maxsize=None)
+def load_tools_config():
+    if not TOOLS_CONFIG_PATH.exists():
+        return None
+    return json_loads(TOOLS_CONFIG_PATH.read_bytes())
+
+def pytest_generate_tests(metafunc):
+    if "tool_url" in metafunc.fixturenames:
+        tools = (load_tools_config() or {}).get('tools', {})
+        cases = [
+            (f"{category}/{tool_name}", tool_config['url'])
+            for category, tool_list in tools.items()
+            for tool_name, tool_config in tool_list.items()
+            if 'url' in tool_config
+        ]
+        metafunc.parametrize("tool_name,tool_url", cases, ids=[name for name, _url in cases])
+
+@pytest.fixture(scope="session")
+def tools_config():
+    return load_tools_config()
+
+@pytest.fixture(scope="session")
+def psutil_mod():
+    import psutil
+    return psutil
+
+@pytest.fixture(scope="session")
+def capture_module():
+    try:
+        import capture_artifacts
+    except ImportError:
+        pytest.skip("capture_artifacts module not available")
+    return capture_artifacts
+
+@pytest.fixture(scope="session")
+def install_module():
+    try:
+        import install_tools
+    except ImportError:
+        pytest.skip("install_tools module not available")
+    return install_tools
@@ -0,0 +1,133 @@
+import io
+import json
+import zipfile
+
+def _build_zip(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in entries:
+            archive.writestr(zipfile.ZipInfo(name), data)
+    return buffer.getvalue()
+
+def test_zip_entry_target_refuses_unsafe_names(install_module, tmp_path):
+    for name in ('../evil', 'nested/../../evil', '/abs.txt', '\\abs.txt', 'C:/abs.txt', 'dir\\..\\..\\evil'):
+        assert install_module.zip_entry_target(tmp_path, name) is None, name
+
+def test_zip_entry_target_resolves_safe_names(install_module, tmp_path):
+    assert install_module.zip_entry_target(tmp_path, 'ok.txt') == tmp_path / 'ok.txt'
+    assert install_module.zip_entry_target(tmp_path, 'dir/') == tmp_path / 'dir'
+    assert install_module.zip_entry_target(tmp_path, 'dir\\sub.txt') == tmp_path / 'dir' / 'sub.txt'
+
+def test_extract_zip_writes_safe_entries_only(install_module, tmp_path):
+    zip_path = tmp_path / 'tool.zip'
+    zip_path.write_bytes(_build_zip([
+        ('../evil', b'escaped'),
+        ('/abs.txt', b'absolute'),
+        ('dir/', b''),
+        ('dir/sub.txt', b'nested'),
+        ('ok.txt', b'payload'),
+    ]))
+    destination = tmp_path / 'out' / 'tool'
+
+    assert install_module.extract_zip(zip_path, destination) is True
+
+    assert (destination / 'ok.txt').read_bytes() == b'payload'
+    assert (destination / 'dir').is_dir()
+    assert (destination / 'dir' / 'sub.txt').read_bytes() == b'nested'
+    assert not (tmp_path / 'out' / 'evil').exists()
+    assert not (destination / 'abs.txt').exists()
+    written = sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob('*') if path.is_file())
+    assert written == ['out/tool/dir/sub.txt', 'out/tool/ok.txt', 'tool.zip']
+
+class _FakeResponse:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self._body = io.BytesIO(body)
+
+    def read(self, size=-1):
+        return self._body.read(size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+class _FakeServer:
+    def __init__(self, body, etag, honour_ranges=True):
+        self.body = body
+        self.etag = etag
+        self.honour_ranges = honour_ranges
+        self.requests = []
+
+    def headers(self):
+        return {"ETag": self.etag, "Content-Length": str(len(self.body)), "Accept-Ranges": "bytes"}
+
+    def urlopen(self, request, timeout=None):
+        method = request if isinstance(request, str) else request.get_method()
+        range_header = None if isinstance(request, str) else request.get_header("Range")
+        if method == "HEAD":
+            self.requests.append("HEAD")
+            return _FakeResponse(200, self.headers(), b"")
+        if range_header and self.honour_ranges:
+            self.requests.append(range_header)
+            start, end = (int(bound) for bound in range_header.split("=")[1].split("-"))
+            return _FakeResponse(206, self.headers(), self.body[start:end + 1])
+        self.requests.append(range_header or "GET")
+        return _FakeResponse(200, self.headers(), self.body)
+
+def _serve(install_module, monkeypatch, server):
+    monkeypatch.setattr(install_module.urllib.request, "urlopen", server.urlopen)
+    monkeypatch.setattr(install_module, "USE_DOWNLOAD_CACHE", True)
+    monkeypatch.setattr(install_module, "RANGED_DOWNLOAD_MIN_SIZE", 1)
+    monkeypatch.setattr(install_module, "DOWNLOAD_CHUNK_SIZE", 7)
+
+def test_fetch_ranges_reassembles_parts(install_module, monkeypatch, tmp_path):
+    server = _FakeServer(bytes(range(256)) * 4, '"v1"')
+    _serve(install_module, monkeypatch, server)
+    destination = tmp_path / "tool.bin"
+
+    assert install_module.fetch_ranges("https://example.test/tool.bin", destination, len(server.body), 4, False) == len(server.body)
+    assert destination.read_bytes() == server.body
+    assert sorted(server.requests) == ["bytes=0-255", "bytes=256-511", "bytes=512-767", "bytes=768-1023"]
+
+def test_fetch_file_falls_back_to_single_stream_when_range_ignored(install_module, monkeypatch, tmp_path):
+    server = _FakeServer(bytes(range(256)) * 4, '"v1"', honour_ranges=False)
+    _serve(install_module, monkeypatch, server)
+    destination = tmp_path / "tool.bin"
+
+    assert install_module.fetch_file("https://example.test/tool.bin", destination, False, parts=4) is True
+    assert destination.read_bytes() == server.body
+    assert server.requests[-1] == "GET"
+    assert server.requests.count("GET") == 1
+    stored = json.loads(install_module.download_meta_path(destination).read_text())
+    assert stored == {"url": "https://example.test/tool.bin", "etag": '"v1"', "content_length": str(len(server.body))}
+
+def test_download_cache_invalidated_when_remote_changes(install_module, monkeypatch, tmp_path):
+    url = "https://example.test/tool.bin"
+    server = _FakeServer(b"first release", '"v1"')
+    _serve(install_module, monkeypatch, server)
+    destination = tmp_path / "tool.bin"
+
+    assert install_module.fetch_file(url, destination, False) is True
+    assert install_module.fetch_file(url, destination, False) is True
+    assert server.requests == ["HEAD", "GET", "HEAD"]
+
+    server.body, server.etag = b"second release, larger", '"v2"'
+    meta = install_module.remote_metadata(url, server.headers())
+    assert install_module.cached_download_valid(destination, meta) is False
+
+    server.requests.clear()
+    assert install_module.fetch_file(url, destination, False) is True
+    assert server.requests == ["HEAD", "GET"]
+    assert destination.read_bytes() == b"second release, larger"
+    assert install_module.cached_download_valid(destination, meta) is True
+
+def test_download_cache_invalidated_when_local_size_differs(install_module, tmp_path):
+    destination = tmp_path / "tool.bin"
+    destination.write_bytes(b"truncated")
+    meta = {"url": "https://example.test/tool.bin", "etag": '"v1"', "content_length": "64"}
+    install_module.download_meta_path(destination).write_text(json.dumps(meta))
+
+    assert install_module.cached_download_valid(destination, meta) is False